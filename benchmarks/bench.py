@@ -0,0 +1,125 @@
+"""
+Benchmarks the hot path of `PxlClient` against a local mock pxlapi server.
+
+Reports throughput, latency percentiles and the peak of memory allocated by Python for representative methods at several concurrency levels.
+With `--transport memory` no server is started and canned responses are served in memory, which measures the overhead of the client alone.
+Run it from the root of the repository with `python -m benchmarks.bench`, see `--help` for options
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import time
+import tracemalloc
+
+from pypxl import PxlClient, Http2Transport, MemoryTransport, CannedResponse
+from benchmarks.mock_server import MockServer
+
+SCENARIOS = {
+    'glitch': {'images': ['https://example.com/avatar.gif']},
+    'flag': {'flag': 'trans', 'images': ['https://example.com/avatar.png']},
+    'image_search': {'query': 'cat', 'meta': True},
+    'screenshot': {'url': 'https://example.com'}
+}
+
+def percentile(values:list, q:float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(q * len(values)) - 1))
+    return values[index]
+
+async def run_scenario(client:PxlClient, method:str, requests:int, concurrency:int, memory:bool) -> dict:
+    """
+    Makes `requests` calls of `method` with at most `concurrency` in flight
+
+    # Returns:
+        `dictionary` with the measurements
+    """
+    latencies = []
+    failures = 0
+
+    async def timed(**kwargs):
+        start = time.perf_counter()
+        res = await getattr(client, method)(**kwargs)
+        latencies.append(time.perf_counter() - start)
+        return res
+
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    async for res in client.map(timed, (SCENARIOS[method] for _ in range(requests)), concurrency=concurrency):
+        if not res.success:
+            failures += 1
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] if memory else None
+    if memory:
+        tracemalloc.stop()
+
+    return {
+        'method': method,
+        'concurrency': concurrency,
+        'requests': requests,
+        'failures': failures,
+        'throughput': requests / elapsed,
+        'p50': percentile(latencies, 0.50),
+        'p95': percentile(latencies, 0.95),
+        'p99': percentile(latencies, 0.99),
+        'peak_memory': peak
+    }
+
+def print_row(row:dict) -> None:
+    memory = f"{row['peak_memory'] / 1024 / 1024:10.1f}" if row['peak_memory'] is not None else f"{'-':>10}"
+    print(
+        f"{row['method']:<14}{row['concurrency']:>6}{row['requests']:>8}{row['failures']:>6}"
+        f"{row['throughput']:>10.1f}{row['p50'] * 1000:>9.1f}{row['p95'] * 1000:>9.1f}{row['p99'] * 1000:>9.1f}{memory}"
+    )
+
+def memory_transport(args:argparse.Namespace) -> MemoryTransport:
+    """
+    Serves the same payloads as the mock server from memory
+    """
+    payload = b'GIF89a' + os.urandom(max(args.payload_size - 6, 0))
+    results = [{'url': f'https://example.com/{i}.png', 'title': f'Result {i}', 'location': f'https://example.com/{i}'} for i in range(50)]
+    return MemoryTransport({
+        'image_search': CannedResponse(json.dumps(results).encode(), content_type='application/json'),
+        'screenshot': CannedResponse(payload, content_type='image/png')
+    }, default=CannedResponse(payload, content_type='image/gif'), latency=args.latency)
+
+def create_transport(args:argparse.Namespace):
+    if args.transport == 'http2':
+        return Http2Transport()
+    if args.transport == 'memory':
+        return memory_transport(args)
+    return None
+
+async def main(args:argparse.Namespace) -> None:
+    if args.transport == 'memory':
+        server = contextlib.nullcontext()
+        print(f"In memory transport: latency {args.latency * 1000:.0f}ms, payload {args.payload_size} bytes")
+    else:
+        server = MockServer(latency=args.latency, jitter=args.jitter, payload_size=args.payload_size, error_rate=args.error_rate)
+    async with server:
+        if args.transport != 'memory':
+            print(f"Mock pxlapi on {server.url} over {args.transport}: latency {args.latency * 1000:.0f}ms, payload {args.payload_size} bytes, error rate {args.error_rate:.1%}")
+        print(f"{'method':<14}{'conc':>6}{'reqs':>8}{'fail':>6}{'req/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'peak MiB':>10}")
+        for method in args.methods:
+            for concurrency in args.concurrency:
+                base_url = server.url if args.transport != 'memory' else 'https://api.pxlapi.dev'
+                async with PxlClient('benchmark', base_url=base_url, transport=create_transport(args)) as client:
+                    await run_scenario(client, method, min(concurrency, args.requests), concurrency, False) # Warm up the connection pool
+                    print_row(await run_scenario(client, method, args.requests, concurrency, args.memory))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark pypxl against a local mock pxlapi server')
+    parser.add_argument('--methods', nargs='+', default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument('--concurrency', nargs='+', type=int, default=[1, 8, 32, 128])
+    parser.add_argument('--requests', type=int, default=500, help='Requests per method and concurrency level')
+    parser.add_argument('--latency', type=float, default=0.02, help='Server side latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.005, help='Maximum deviation of the latency in seconds')
+    parser.add_argument('--payload-size', type=int, default=256*1024, help='Size of image responses in bytes')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Share of requests answered with a 500 error')
+    parser.add_argument('--transport', default='aiohttp', choices=('aiohttp', 'http2', 'memory'), help='How to send requests, http2 requires httpx and falls back to HTTP/1.1 against the plain text mock server, memory skips the server')
+    parser.add_argument('--no-memory', dest='memory', action='store_false', help='Do not trace memory, tracing slows down requests')
+    asyncio.run(main(parser.parse_args()))
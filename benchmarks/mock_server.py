@@ -0,0 +1,106 @@
+"""
+A local stand-in for pxlapi serving the endpoints `PxlClient` uses, with configurable latency, payload sizes and error rate.
+
+Run it on its own with `python -m benchmarks.mock_server --port 8080` or start it from code with `MockServer`
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+
+from aiohttp import web
+
+TEXT_ENDPOINTS = ('image_search', 'web_search', 'imagescript/versions')
+
+class MockServer:
+    """
+    A mock pxlapi server
+
+    # Optional parameters:
+        `latency (float)`: How many seconds each request takes on average
+        `jitter (float)`: How many seconds the latency varies by at most
+        `payload_size (int)`: How many bytes image responses have
+        `error_rate (float)`: The share of requests answered with a 500 error
+        `host (string)`: Which host to listen on
+        `port (int)`: Which port to listen on, 0 for any free one
+
+    # Properties:
+        url (string): The base url to pass to `PxlClient` once started
+        requests (int): How many requests were served
+    """
+    def __init__(self, latency:float=0.05, jitter:float=0.0, payload_size:int=256*1024, error_rate:float=0.0, host:str='127.0.0.1', port:int=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.payload_size = payload_size
+        self.error_rate = error_rate
+        self.host = host
+        self.port = port
+        self.url = None
+        self.requests = 0
+        self._runner = None
+        self._payload = b'GIF89a' + os.urandom(max(payload_size - 6, 0))
+        self._results = json.dumps([
+            {'url': f'https://example.com/{i}.png', 'title': f'Result {i}', 'location': f'https://example.com/{i}'} for i in range(50)
+        ]).encode()
+
+    async def _handle(self, request:web.Request) -> web.Response:
+        self.requests += 1
+        await request.read()
+        delay = self.latency + random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.error_rate and random.random() < self.error_rate:
+            return web.Response(status=500, text='Mock error')
+
+        endpoint = request.match_info['endpoint']
+        if endpoint == 'imagescript/versions':
+            return web.Response(body=b'["1.2.17"]', content_type='application/json')
+        if endpoint in TEXT_ENDPOINTS:
+            return web.Response(body=self._results, content_type='application/json')
+        content_type = 'image/png' if endpoint in ('screenshot', 'jpeg') else 'image/gif'
+        return web.Response(body=self._payload, content_type=content_type)
+
+    async def start(self) -> str:
+        app = web.Application(client_max_size=64*1024*1024)
+        app.router.add_post('/{endpoint:.+}', self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f'http://{self.host}:{port}'
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.stop()
+
+async def _serve(args:argparse.Namespace) -> None:
+    server = MockServer(args.latency, args.jitter, args.payload_size, args.error_rate, args.host, args.port)
+    print(f'Mock pxlapi listening on {await server.start()}')
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run a mock pxlapi server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--payload-size', type=int, default=256*1024)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,48 @@
+"""
+Measures the client side overhead of `PxlClient` which does not depend on the network:
+constructing a client and validating the arguments / building the request of each endpoint.
+
+Run it from the root of the repository with `python -m benchmarks.overhead`
+"""
+import argparse
+import timeit
+
+from pypxl import PxlClient
+from pypxl.endpoints import ENDPOINTS
+
+ARGUMENTS = {
+    'flag': {'flag': 'Trans'},
+    'snapchat': {'filter': 'dog'},
+    'eyes': {'eyes': 'googly'},
+    'thonkify': {'text': 'hello'},
+    'sonic': {'text': 'gotta go fast'},
+    'klines': {'pair': 'BNBBUSD'},
+    'imagescript': {'version': '1.2.17', 'code': 'return 1'},
+    'image_search': {'query': 'cat'},
+    'screenshot': {'url': 'https://example.com'},
+    'web_search': {'query': 'cat'}
+}
+
+def arguments(endpoint) -> dict:
+    args = {p.name: p.default for p in endpoint.params}
+    if 'images' in args:
+        args['images'] = ['https://example.com/avatar.png']
+    args.update(ARGUMENTS.get(endpoint.name, {}))
+    return args
+
+def prepare(endpoint, args:dict) -> tuple:
+    args = dict(args)
+    endpoint.validate(args)
+    return endpoint.build(args)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the client side overhead of pypxl')
+    parser.add_argument('--number', type=int, default=100000)
+    number = parser.parse_args().number
+
+    seconds = min(timeit.repeat(lambda: PxlClient('token'), number=number, repeat=3))
+    print(f"{'PxlClient()':<22}{seconds / number * 1e6:8.2f} us")
+    for endpoint in ENDPOINTS:
+        args = arguments(endpoint)
+        seconds = min(timeit.repeat(lambda: prepare(endpoint, args), number=number, repeat=3))
+        print(f"{endpoint.name:<22}{seconds / number * 1e6:8.2f} us")
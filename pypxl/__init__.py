@@ -12,4 +12,21 @@ __copyright__ = "Copyright 2024 Kile"
 __version__ = "0.2.4"
 
 from .client import PxlClient
-from .errors import PxlapiException
\ No newline at end of file
+from .sync import SyncPxlClient, SyncPipeline, LoopThread
+from .errors import PxlapiException, CircuitOpen, DeadlineExceeded
+from .pxl_object import PxlObject, BufferReader
+from .imageinfo import ImageInfo, Frame, image_info, iter_frames
+from .cache import ImageCache, DiskCache, TextCache
+from .prefetch import Prefetcher
+from .coalesce import SingleFlight
+from .ratelimit import RateLimiter, RetryPolicy, TokenBucket
+from .stream import ChunkStream, spool
+from .session import PoolConfig, ConnectionStats
+from .transport import Transport, AiohttpTransport, Http2Transport, MemoryTransport, CannedResponse
+from .metrics import Metrics, Histogram
+from .codec import JsonCodec, get_codec
+from .preprocess import Preprocessor
+from .hedging import HedgePolicy
+from .breaker import CircuitBreaker
+from .scheduler import Scheduler
+from .pipeline import Pipeline, Stage, PipelineResult
\ No newline at end of file
@@ -0,0 +1,154 @@
+import inspect
+import asyncio
+import time
+from collections import deque
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+class Circuit:
+    """
+    The state of the circuit of one endpoint
+
+    # Properties:
+        state (string): `closed` while requests go through, `open` while they fail fast and `half_open` while probing if the endpoint recovered
+        outcomes (deque): Whether the latest requests succeeded
+        opened_at (float): When the circuit was opened last
+        probes (int): How many probes are in flight
+    """
+    __slots__ = ('state', 'outcomes', 'opened_at', 'probes')
+
+    def __init__(self, window:int):
+        self.state = CLOSED
+        self.outcomes = deque(maxlen=window)
+        self.opened_at = 0.0
+        self.probes = 0
+
+class CircuitBreaker:
+    """
+    Fails requests to an endpoint immediately while the endpoint is failing or too slow instead of letting every request wait for a timeout.
+    After `open_for` seconds a few probe requests are let through and the circuit closes again once they succeed
+
+    # Optional parameters:
+        `failure_rate (float)`: The share of failed requests in the window at which the circuit opens
+        `min_requests (int)`: How many requests have to be in the window before the circuit can open
+        `window (int)`: How many of the latest requests per endpoint are considered
+        `slow_call (float)`: Requests taking longer than this many seconds count as failed, None to only count errors
+        `open_for (float)`: How many seconds to fail fast before probing
+        `probes (int)`: How many probe requests may be in flight at once while half open
+        `on_state_change (list)`: Functions called with `(endpoint, old state, new state)` when a circuit changes state
+
+    # Properties:
+        circuits (dictionary): The `Circuit` of every endpoint by name
+        rejected (int): How many requests failed fast
+    """
+    def __init__(self, failure_rate:float=0.5, min_requests:int=10, window:int=20, slow_call:float=None, open_for:float=30.0, probes:int=1, on_state_change:list=None):
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.slow_call = slow_call
+        self.open_for = open_for
+        self.probes = probes
+        self.on_state_change = on_state_change if on_state_change is not None else []
+        self.circuits = {}
+        self.rejected = 0
+
+    def _circuit(self, name:str) -> Circuit:
+        circuit = self.circuits.get(name)
+        if circuit is None:
+            circuit = self.circuits[name] = Circuit(self.window)
+        return circuit
+
+    def state(self, endpoint:str) -> str:
+        return self._circuit(endpoint.split('/')[0]).state
+
+    def _change(self, name:str, circuit:Circuit, state:str) -> None:
+        old = circuit.state
+        circuit.state = state
+        if old == HALF_OPEN: # Probes still in flight have no slot to give back anymore
+            circuit.probes = 0
+        if state == OPEN:
+            circuit.opened_at = time.monotonic()
+        elif state == CLOSED:
+            circuit.outcomes.clear()
+        for callback in self.on_state_change:
+            res = callback(name, old, state)
+            if inspect.isawaitable(res):
+                asyncio.ensure_future(res)
+
+    def rejects(self, endpoint:str) -> bool:
+        """
+        Checks if requests to `endpoint` fail fast right now without taking a probe slot,
+        so they can fail before waiting for the rate limiter or a scheduler
+
+        # Returns:
+            `boolean`
+        """
+        circuit = self.circuits.get(endpoint.split('/')[0])
+        if circuit is not None and circuit.state == OPEN and time.monotonic() - circuit.opened_at < self.open_for:
+            self.rejected += 1
+            return True
+        return False
+
+    def allow(self, endpoint:str) -> bool:
+        """
+        Checks if a request to `endpoint` may be sent. Every allowed request has to be followed by `record` or `release`
+
+        # Returns:
+            `boolean`
+        """
+        name = endpoint.split('/')[0]
+        circuit = self._circuit(name)
+        if circuit.state == OPEN:
+            if time.monotonic() - circuit.opened_at < self.open_for:
+                self.rejected += 1
+                return False
+            self._change(name, circuit, HALF_OPEN)
+        if circuit.state == HALF_OPEN:
+            if circuit.probes >= self.probes:
+                self.rejected += 1
+                return False
+            circuit.probes += 1
+        return True
+
+    def record(self, endpoint:str, success:bool, seconds:float) -> None:
+        """
+        Records the outcome of a request
+
+        # Parameters:
+            `endpoint (string)`: The endpoint the request was made to
+            `success (boolean)`: Whether pxlapi answered without a server or connection error
+            `seconds (float)`: How long the request took
+        """
+        name = endpoint.split('/')[0]
+        circuit = self._circuit(name)
+        ok = success and (self.slow_call is None or seconds <= self.slow_call)
+        if circuit.state == HALF_OPEN:
+            if circuit.probes:
+                circuit.probes -= 1
+            self._change(name, circuit, CLOSED if ok else OPEN)
+            return
+        if circuit.state == OPEN: # A request sent before the circuit opened
+            return
+
+        circuit.outcomes.append(ok)
+        if not ok and len(circuit.outcomes) >= self.min_requests:
+            failures = circuit.outcomes.count(False)
+            if failures >= self.failure_rate * len(circuit.outcomes):
+                self._change(name, circuit, OPEN)
+
+    def release(self, endpoint:str) -> None:
+        """
+        Gives back an allowed request which was cancelled before it had an outcome
+        """
+        circuit = self._circuit(endpoint.split('/')[0])
+        if circuit.state == HALF_OPEN and circuit.probes:
+            circuit.probes -= 1
+
+    def stats(self) -> dict:
+        return {
+            'rejected': self.rejected,
+            'open': sum(circuit.state == OPEN for circuit in self.circuits.values()),
+            'half_open': sum(circuit.state == HALF_OPEN for circuit in self.circuits.values())
+        }
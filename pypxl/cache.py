@@ -0,0 +1,386 @@
+import asyncio
+import hashlib
+import mmap
+import os
+import tempfile
+import time
+from collections import OrderedDict
+
+try:
+    import fcntl
+except ImportError: # Not available on Windows, writes are still atomic but eviction is not locked
+    fcntl = None
+
+from .pxl_object import PxlObject
+
+# Endpoints whose output changes between identical requests, these are never cached. klines draws the latest candles of a pair
+NON_DETERMINISTIC = ("glitch", "imagescript", "screenshot", "klines")
+
+def is_deterministic(endpoint:str, body:dict) -> bool:
+    """
+    Checks if a request to an endpoint is expected to always return the same image
+
+    # Parameters:
+        `endpoint (string)`: The endpoint the request is made to
+        `body (bytes)`: The encoded body of the request
+
+    # Returns:
+        `boolean`
+    """
+    if endpoint.split('/')[0] in NON_DETERMINISTIC:
+        return False
+    if endpoint.endswith('/random'): # random snapchat filters and eyes
+        return False
+    return True
+
+def make_key(endpoint:str, body:bytes) -> str:
+    """
+    Creates a content addressed cache key out of the endpoint and the encoded body. Codecs sort keys, so bodies passed as dictionaries
+    give the same key whatever order their keys are in
+
+    # Parameters:
+        `endpoint (string)`: The endpoint the request is made to
+        `body (bytes)`: The encoded body of the request
+
+    # Returns:
+        `string`
+    """
+    digest = hashlib.sha256(endpoint.encode())
+    digest.update(b'\n')
+    digest.update(body)
+    return digest.hexdigest()
+
+class ImageCache:
+    """
+    An in-memory least recently used cache for image responses
+
+    # Optional parameters:
+        `max_entries (int)`: How many responses to keep at most
+        `max_bytes (int)`: How many image bytes to keep at most in total
+
+    # Properties:
+        hits (int): How often a response was served from the cache
+        misses (int): How often a response was not in the cache
+        evictions (int): How many responses were dropped to stay within the limits
+        size (int): How many image bytes are currently cached
+
+    # Methods:
+        `get(key)`
+            Returns the cached `PxlObject` or None
+        `put(key, obj)`
+            Caches a successful `PxlObject`
+        `clear()`
+            Empties the cache
+        `stats()`
+            Returns the counters as a dictionary
+    """
+    def __init__(self, max_entries:int=256, max_bytes:int=64*1024*1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key:str) -> bool:
+        return key in self._entries
+
+    def get(self, key:str) -> PxlObject:
+        obj = self._entries.get(key)
+        if obj is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return obj
+
+    def put(self, key:str, obj:PxlObject) -> None:
+        if not obj.success or obj.image_bytes is None:
+            return
+        nbytes = obj.size
+        if nbytes > self.max_bytes:
+            return
+        if key in self._entries:
+            self.size -= self._entries.pop(key).size
+        self._entries[key] = obj
+        self.size += nbytes
+
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.size
+        }
+
+class DiskCache:
+    """
+    A persistent least recently used cache for image responses, stored as one file per response in a directory.
+    Files are written atomically so several processes on one host can share the same directory.
+    Hits are memory mapped, the returned `PxlObject` holds a `memoryview` of the file instead of a copy of its bytes
+
+    # Parameters:
+        `path (string)`: The directory to store the responses in
+
+    # Optional parameters:
+        `max_bytes (int)`: How many bytes the directory may hold at most
+        `rescan_every (int)`: After how many writes the directory is rescanned to account for writes of other processes
+
+    # Properties:
+        hits (int): How often a response was served from the cache
+        misses (int): How often a response was not in the cache
+        evictions (int): How many responses were deleted to stay within the limit
+        size (int): How many bytes the directory holds as of the last scan plus the writes since
+
+    # Methods:
+        `get(key)`
+            Returns the cached `PxlObject` or None
+        `put(key, obj)`
+            Writes a successful `PxlObject` to disk
+        `clear()`
+            Deletes all cached responses
+        `stats()`
+            Returns the counters as a dictionary
+    """
+    MAGIC = b'PXL1'
+    SUFFIX = '.pxl'
+
+    def __init__(self, path:str, max_bytes:int=1024*1024*1024, rescan_every:int=64):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.rescan_every = rescan_every
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._writes = 0
+        os.makedirs(path, exist_ok=True)
+        self.size = self._scan_size()
+
+    def _file(self, key:str) -> str:
+        return os.path.join(self.path, key + self.SUFFIX)
+
+    def _entries(self) -> list:
+        entries = []
+        for entry in os.scandir(self.path):
+            if not entry.name.endswith(self.SUFFIX):
+                continue
+            try:
+                st = entry.stat()
+            except FileNotFoundError: # Deleted by another process
+                continue
+            entries.append((st.st_mtime, st.st_size, entry.path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _lock(self):
+        lock = open(os.path.join(self.path, '.lock'), 'a+')
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        return lock
+
+    def get(self, key:str) -> PxlObject:
+        path = self._file(key)
+        try:
+            with open(path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError): # ValueError is raised for empty files
+            self.misses += 1
+            return None
+
+        header_end = mm.find(b'\n')
+        if not mm[:len(self.MAGIC)] == self.MAGIC or header_end == -1:
+            mm.close()
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(path) # The modification time is used as the recency for eviction
+        except OSError:
+            pass
+        self.hits += 1
+        content_type = mm[len(self.MAGIC):header_end].decode() or None
+        return PxlObject(success=True, image_bytes=memoryview(mm)[header_end+1:], content_type=content_type)
+
+    def put(self, key:str, obj:PxlObject) -> None:
+        if not obj.success or obj.image_bytes is None:
+            return
+        header = self.MAGIC + (obj.content_type or '').encode() + b'\n'
+        nbytes = len(header) + obj.size
+        if nbytes > self.max_bytes:
+            return
+
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header)
+                f.write(obj.image_bytes)
+            os.replace(tmp, self._file(key))
+        except OSError: # On Windows a file cannot be replaced while it is mapped
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+
+        self.size += nbytes
+        self._writes += 1
+        if self.size > self.max_bytes or self._writes % self.rescan_every == 0:
+            self._evict()
+
+    def _evict(self) -> None:
+        with self._lock():
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError: # Already removed by another process or still mapped on Windows
+                    continue
+                total -= size
+                self.evictions += 1
+            self.size = total
+
+    def clear(self) -> None:
+        with self._lock():
+            for _, _, path in self._entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self.size = 0
+
+    def stats(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'bytes': self.size
+        }
+
+class TextCache:
+    """
+    An in-memory cache for the json responses of text endpoints such as `image_search`, whose results change slowly.
+    Once an entry is older than its ttl it is still served for `stale` more seconds while a fresh response is fetched in the background
+
+    # Optional parameters:
+        `ttl (float)`: How many seconds a response is fresh
+        `stale (float)`: How many seconds after that a response is still served while it is refreshed
+        `ttls (dictionary)`: The ttl of specific endpoints by path or first path segment, e.g. `{"imagescript/versions": 3600}`
+        `max_entries (int)`: How many responses to keep at most
+
+    # Properties:
+        hits (int): How often a fresh response was served
+        stale_hits (int): How often a stale response was served while it was refreshed
+        misses (int): How often a response was not in the cache or too old
+        refreshes (int): How many background refreshes were started
+    """
+    def __init__(self, ttl:float=300.0, stale:float=300.0, ttls:dict=None, max_entries:int=1024):
+        self.ttl = ttl
+        self.stale = stale
+        self.ttls = ttls if ttls is not None else {'imagescript/versions': 3600.0}
+        self.max_entries = max_entries
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self._entries = OrderedDict() # key -> (fresh until, stale until, PxlObject)
+        self._refreshing = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, endpoint:str) -> float:
+        ttl = self.ttls.get(endpoint)
+        if ttl is None:
+            ttl = self.ttls.get(endpoint.split('/')[0], self.ttl)
+        return ttl
+
+    def get(self, key:str) -> tuple:
+        """
+        Looks up a response
+
+        # Returns:
+            `(PxlObject, fresh)` or None if there is no response which may still be served
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            now = time.monotonic()
+            if now < entry[0]:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2], True
+            if now < entry[1]:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                return entry[2], False
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key:str, endpoint:str, obj:PxlObject) -> None:
+        if not obj.success:
+            return
+        fresh = time.monotonic() + self.ttl_for(endpoint)
+        self._entries[key] = (fresh, fresh + self.stale, obj)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def refresh(self, key:str, endpoint:str, factory) -> None:
+        """
+        Fetches a fresh response in the background unless that already happens
+
+        # Parameters:
+            `key (string)`: The cache key
+            `endpoint (string)`: The endpoint of the request
+            `factory (callable)`: Returns the coroutine making the request
+        """
+        if key not in self._refreshing:
+            self.refreshes += 1
+            self._refreshing[key] = asyncio.ensure_future(self._refresh(key, endpoint, factory))
+
+    async def _refresh(self, key:str, endpoint:str, factory) -> None:
+        try:
+            self.put(key, endpoint, await factory())
+        except Exception: # The stale response keeps being served until it expires
+            pass
+        finally:
+            self._refreshing.pop(key, None)
+
+    def cancel(self) -> None:
+        """
+        Cancels the refreshes in flight
+        """
+        for task in self._refreshing.values():
+            task.cancel()
+        self._refreshing.clear()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'refreshes': self.refreshes,
+            'entries': len(self._entries)
+        }
@@ -1,10 +1,49 @@
 import aiohttp
-from .errors import PxlapiException, InvalidFlag, TooManyCharacters, InvalidSafety, InvalidEyes
+from .errors import PxlapiException, CircuitOpen, DeadlineExceeded
 from .pxl_object import PxlObject
+from .cache import ImageCache, DiskCache, TextCache, is_deterministic, make_key
+from .coalesce import SingleFlight
+from .ratelimit import RateLimiter, RetryPolicy, retry_after
+from .stream import ChunkStream, write_chunks, readable_sink, CHUNK_SIZE
+from .session import PoolConfig, ConnectionStats
+from .transport import Transport, AiohttpTransport
+from .metrics import Metrics
+from .codec import get_codec
+from .preprocess import Preprocessor, prepare_images
+from .hedging import HedgePolicy
+from .breaker import CircuitBreaker
+from .scheduler import Scheduler, current_call
+from .pipeline import Pipeline
+from .prefetch import Prefetcher
+from .endpoints import FLAGS, FILTERS, SAFE_SEARCH, EYES, Endpoint
+from .methods import EndpointMethods
+
+import asyncio
+
+from contextvars import ContextVar
+
+from typing import Iterable, AsyncIterator
+
+# The loop time by which the call being made has to finish, so every attempt of its request can be bounded by it
+call_deadline = ContextVar('pypxl_call_deadline', default=None)
+
+def detached(factory):
+    """
+    Wraps a coroutine factory so the coroutine runs without the deadline of the call starting it. Used for work which is shared with
+    other calls or runs in the background, each waiting call enforces its own deadline instead
 
-from typing import List
+    # Parameters:
+        `factory (callable)`: Returns the coroutine to run in its own task
 
-class PxlClient:
+    # Returns:
+        `callable` returning the wrapped coroutine
+    """
+    async def run():
+        call_deadline.set(None) # Only changes the context copied into the task running this
+        return await factory()
+    return run
+
+class PxlClient(EndpointMethods):
     """
     The class which allows you to make requests to pxlapi
 
@@ -12,441 +51,562 @@ class PxlClient:
         `token (string)`: Your pxlapi token
 
     # Optional parameters:
-        `session (aiohttp client session)`: The session to use for requests
+        `session (aiohttp client session)`: The session to use for requests. If none is passed the client creates and owns one, close it with `close()` or use the client as `async with PxlClient(...) as pxl:`
         `stop_on_error (boolean)`: If the code should raise an error if something went wrong or return the error text instead
+        `cache (ImageCache)`: A cache to serve repeated deterministic image requests from
+        `disk_cache (DiskCache)`: A persistent cache checked after `cache`, survives restarts and can be shared between processes
+        `coalesce (boolean)`: If concurrent identical requests should share one request to pxlapi. See `single_flight.stats()` for how many were deduplicated
+        `rate_limiter (RateLimiter)`: Limits how fast requests are sent and pauses endpoints pxlapi reports as rate limited
+        `retry (RetryPolicy)`: When to retry requests failing with a connection error, 429 or 5xx status
+        `pool (PoolConfig)`: Connection pool settings for the session the client creates. See `pool_stats.stats()` for how often connections were reused
+        `metrics (Metrics)`: Where to record latency, payload sizes and errors of requests
+        `base_url (string)`: Where pxlapi is hosted, e.g. a local mock server for benchmarks
+        `codec (string or JsonCodec)`: The json library to use, `"auto"` picks orjson or ujson if installed and falls back to the standard library
+        `preprocessor (Preprocessor)`: Shrinks images passed as bytes, paths or `PxlObject`s before sending them
+        `hedging (HedgePolicy)`: Sends a duplicate of slow requests to deterministic endpoints and uses the first response
+        `breaker (CircuitBreaker)`: Fails requests to endpoints which are failing or too slow immediately instead of waiting for them
+        `scheduler (Scheduler)`: Caps the requests in flight and sends waiting ones by priority, sharing capacity fairly between tenants
+        `deadline (float)`: How many seconds a call may take at most by default, including queueing, retries and reading the response
+        `transport (Transport)`: How requests are sent, e.g. an `Http2Transport` or a `MemoryTransport` for tests. Defaults to an `AiohttpTransport` using `session` and `pool`
+        `text_cache (TextCache)`: A cache for `image_search`, `web_search` and `imagescript_version`, refreshing stale results in the background
+        `prefetcher (Prefetcher)`: Downloads the images of the top results of `image_search` with `meta=True` in the background, get them with `download(url)`
     """
-    def __init__(self, token:str, session:aiohttp.ClientSession, stop_on_error:bool=False) -> PxlObject:
+    def __init__(self, token:str, session:aiohttp.ClientSession=None, stop_on_error:bool=False, cache:ImageCache=None, disk_cache:DiskCache=None, coalesce:bool=False, rate_limiter:RateLimiter=None, retry:RetryPolicy=None, pool:PoolConfig=None, metrics:Metrics=None, base_url:str='https://api.pxlapi.dev', codec='auto', preprocessor:Preprocessor=None, hedging:HedgePolicy=None, breaker:CircuitBreaker=None, scheduler:Scheduler=None, deadline:float=None, transport:Transport=None, text_cache:TextCache=None, prefetcher:Prefetcher=None) -> PxlObject:
         self.token = token
-        self.session = session
+        self.flags = list(FLAGS)
+        self.filters = list(FILTERS)
+        self.safe_search = list(SAFE_SEARCH)
+        self.valid_eyes = list(EYES)
+        self.base_url = base_url.rstrip('/')
+        self.owns_session = session is None and transport is None
+        self.pool = pool or PoolConfig()
+        self.pool_stats = ConnectionStats()
+        self.transport = transport if transport is not None else AiohttpTransport(session, self.pool, self.pool_stats)
+        self.text_cache = text_cache
+        self.prefetcher = prefetcher
         self.stop_on_error = stop_on_error
+        self.cache = cache
+        self.disk_cache = disk_cache
+        self.single_flight = SingleFlight() if coalesce else None
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.metrics = metrics
+        self.codec = get_codec(codec)
+        self.preprocessor = preprocessor
+        self.hedging = hedging
+        self.breaker = breaker
+        self.scheduler = scheduler
+        self.deadline = deadline
+        if metrics is not None:
+            for name, source in (('cache', cache), ('disk_cache', disk_cache), ('single_flight', self.single_flight), ('rate_limiter', rate_limiter), ('retry', retry), ('hedging', hedging), ('breaker', breaker), ('scheduler', scheduler), ('transport', transport), ('text_cache', text_cache), ('prefetcher', prefetcher), ('pool', self.pool_stats if self.owns_session else None)):
+                if source is not None:
+                    metrics.add_source(name, source)
+
+        self._headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Application {self.token}'
+        }
+        self._urls = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        The aiohttp session requests are sent with, None if it was not created yet or another transport is used
+        """
+        return getattr(self.transport, 'session', None)
 
-        self.flags = ["asexual", "aromantic", "bisexual", "pansexual", "gay", "lesbian", "trans", "nonbinary", "genderfluid", "genderqueer", "polysexual", "austria", "belgium", "botswana", "bulgaria", "ivory", "estonia", "france", "gabon", "gambia", "germany", "guinea", "hungary", "indonesia", "ireland", "italy", "luxembourg", "monaco", "nigeria", "poland", "russia", "romania", "sierraleone", "thailand", "ukraine", "yemen"]
-        self.filters = ["dog", "dog2", "dog3", "pig", "flowers", "clown", "random"] 
-        self.safe_search = ["off", "moderate", "strict"]
-        self.valid_eyes = ["big", "black", "bloodshot", "blue", "default", "googly", "green", "horror", "illuminati", "money", "pink", "red", "small", "spinner", "spongebob", "white", "yellow", "random"]
+    async def __aenter__(self):
+        await self.transport.open()
+        return self
 
-    async def _get_img(self, enpoint: str, body: dict) -> PxlObject:
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
         """
-        The function making the request which gets image bytes in return. Not meant to be used outside of this class
+        Cancels background refreshes and downloads and closes the connections of the transport if the client created them
+        """
+        if self.text_cache is not None:
+            self.text_cache.cancel()
+        if self.prefetcher is not None:
+            self.prefetcher.cancel()
+        await self.transport.close()
+
+    async def _get_img(self, enpoint: str, body, sink=None) -> PxlObject:
+        """
+        The function getting image bytes, either from the cache or from pxlapi. Not meant to be used outside of this class
 
         # Parameters:
             `endpoint (string)`: The endpoint to make the request to
-            `body (dictionary)`: The body of the request
+            `body (dictionary or bytes)`: The body of the request, it is encoded once here and the bytes are used from there on
+            `sink (file, path, file descriptor or writer)`: Where to stream the image to, streamed requests skip caching and coalescing
 
         # Returns:
             `PxlObject`
         """
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Application {self.token}'
-        } 
-        try:
-            r = await self.session.post(f'https://api.pxlapi.dev/{enpoint}', headers=headers, json=body)
-        except Exception as e:
-            if self.stop_on_error:
-                raise e
-            return PxlObject(success=False, error=str(e))
-        if r.status == 200:
-            image_bytes = await r.read()
-            return PxlObject(success=True, image_bytes=image_bytes, content_type=r.content_type)
-        else:
-            error = str(await r.text())
+        if not isinstance(body, bytes):
+            try:
+                body = self.codec.dumps(body)
+            except Exception as e:
+                if self.stop_on_error:
+                    raise e
+                return PxlObject(success=False, error=f'Could not encode the body: {e}')
+        if sink is not None:
+            return await self._post_img(enpoint, body, sink)
+        if (self.cache is None and self.disk_cache is None and self.single_flight is None) or not is_deterministic(enpoint, body):
+            return await self._post_img(enpoint, body)
+
+        key = make_key(enpoint, body)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        if self.disk_cache is not None:
+            cached = self.disk_cache.get(key)
+            if cached is not None:
+                if self.cache is not None:
+                    self.cache.put(key, cached)
+                return cached
+
+        if self.single_flight is not None:
+            return await self.single_flight.do(key, detached(lambda: self._fetch_img(key, enpoint, body)))
+        return await self._fetch_img(key, enpoint, body)
+
+    async def _fetch_img(self, key:str, enpoint: str, body: bytes) -> PxlObject:
+        """
+        Makes the request and stores a successful response in the caches. Not meant to be used outside of this class
+        """
+        res = await self._post_img(enpoint, body)
+        if self.cache is not None:
+            self.cache.put(key, res)
+        if self.disk_cache is not None and res.success:
+            await asyncio.get_running_loop().run_in_executor(None, self.disk_cache.put, key, res)
+        return res
+
+    async def _request(self, enpoint: str, body: bytes) -> aiohttp.ClientResponse:
+        """
+        Sends the request, waiting for the rate limiter, failing fast if the circuit is open and retrying if configured. Not meant to be used outside of this class
 
-            if self.stop_on_error:
-                raise PxlapiException(error)
-            return PxlObject(success=False, error=error)
+        # Parameters:
+            `endpoint (string)`: The endpoint to make the request to
+            `body (bytes)`: The encoded body of the request
 
-    async def _get_text(self, enpoint:str, body:dict) -> PxlObject:
+        # Returns:
+            The response of the last attempt, or raises the error of the last attempt
+        """
+        url = self._urls.get(enpoint)
+        if url is None:
+            url = self._urls[enpoint] = f'{self.base_url}/{enpoint}'
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = call_deadline.get()
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.breaker is not None and not self.breaker.allow(enpoint):
+                raise self._circuit_open(enpoint)
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire(enpoint)
+                sent = loop.time()
+                # The deadline bounds connecting, sending and reading the response together
+                r = await self.transport.post(url, self._headers, body, None if deadline is None else max(deadline - sent, 0.001))
+            except self.transport.errors as e:
+                if self.breaker is not None:
+                    self.breaker.record(enpoint, False, loop.time() - sent)
+                if self.metrics is not None:
+                    self.metrics.error(enpoint, 'connection')
+                if deadline is not None and loop.time() >= deadline:
+                    raise DeadlineExceeded(f'The request to {enpoint} did not finish before its deadline') from e
+                if self.retry is None:
+                    raise
+                delay = self.retry.delay(attempt, loop.time() - start)
+                if delay is None or (deadline is not None and loop.time() + delay >= deadline):
+                    raise
+            except BaseException:
+                if self.breaker is not None:
+                    self.breaker.release(enpoint)
+                raise
+            else:
+                if self.breaker is not None:
+                    self.breaker.record(enpoint, r.status < 500, loop.time() - sent)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(enpoint, r.status, r.headers)
+                if self.metrics is not None and r.status != 200:
+                    self.metrics.error(enpoint, r.status)
+                if r.status == 200 or self.retry is None or r.status not in self.retry.statuses:
+                    return r
+                delay = self.retry.delay(attempt, loop.time() - start, retry_after(r.headers))
+                if delay is None or (deadline is not None and loop.time() + delay >= deadline):
+                    return r
+                r.release()
+            await asyncio.sleep(delay)
+
+    def _circuit_open(self, enpoint:str) -> CircuitOpen:
+        return CircuitOpen(f'Not sending the request because {enpoint} failed too often recently, retrying in at most {self.breaker.open_for} seconds')
+
+    def _reject(self, enpoint:str) -> PxlObject:
+        """
+        Fails a request to an endpoint whose circuit is open before it waits for the scheduler. Not meant to be used outside of this class
+        """
+        error = self._circuit_open(enpoint)
+        if self.stop_on_error:
+            raise error
+        return PxlObject(success=False, error=str(error))
+
+    async def _post_img(self, enpoint: str, body: bytes, sink=None) -> PxlObject:
+        """
+        Makes the request for image bytes once the scheduler lets it through, hedging it if enabled and measuring it if metrics are enabled.
+        The hedge delay only starts once the request has a slot, a duplicate shares that slot instead of queueing again. Not meant to be used outside of this class
+        """
+        def send():
+            if self.metrics is None:
+                return self._send_img(enpoint, body, sink)
+            return self.metrics.observe(enpoint, body, self._send_img(enpoint, body, sink))
+
+        def hedge():
+            return self.hedging.run(enpoint, send)
+
+        factory = hedge if self.hedging is not None and sink is None and self.hedging.eligible(enpoint) else send
+        if self.breaker is not None and self.breaker.rejects(enpoint):
+            return self._reject(enpoint)
+        if self.scheduler is None:
+            return await factory()
+        return await self.scheduler.run(factory)
+
+    async def _send_img(self, enpoint: str, body: bytes, sink=None) -> PxlObject:
         """
-        The function making the request which gets text in return. Not meant to be used outside of this class
+        The function making the request which gets image bytes in return. Not meant to be used outside of this class
 
         # Parameters:
             `endpoint (string)`: The endpoint to make the request to
-            `body (dictionary)`: The body of the request
+            `body (bytes)`: The encoded body of the request
+            `sink (file, path, file descriptor or writer)`: Where to write the image to instead of reading it into memory
 
         # Returns:
             `PxlObject`
         """
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Application {self.token}'
-        } 
         try:
-            r = await self.session.post(f'https://api.pxlapi.dev/{enpoint}', headers=headers, json=body) 
+            r = await self._request(enpoint, body)
         except Exception as e:
             if self.stop_on_error:
                 raise e
             return PxlObject(success=False, error=str(e))
         if r.status == 200:
-            data = await r.json()
-            return PxlObject(data=data, success=True)
+            if sink is None:
+                image_bytes = await r.read()
+                return PxlObject(success=True, image_bytes=image_bytes, content_type=r.content_type)
+            try:
+                size = await write_chunks(r.content.iter_chunked(CHUNK_SIZE), sink)
+            except Exception as e:
+                r.release()
+                if self.stop_on_error:
+                    raise e
+                return PxlObject(success=False, error=str(e))
+            return PxlObject(success=True, file=sink if readable_sink(sink) else None, size=size, content_type=r.content_type)
         else:
             error = str(await r.text())
+
             if self.stop_on_error:
                 raise PxlapiException(error)
+            return PxlObject(success=False, error=error)
 
-            return PxlObject(error=error, success=False)
-
-    async def emojaic(self, images:List[str], groupSize:int=12, scale:bool=False) -> PxlObject:
-        """
-        Turns the provided images into images assebled by emojis
-
-        # Parameters:
-            `images (list)`: The images to proccess
-            `groupSize (int)`: The group size
-            `scale (boolean)`: To have the returned image at the same scale or not
-
-        # Returns:
-            `PxlObject`
-        """
-        body = {
-            'images': images, 
-            'groupSize': groupSize,
-            'scale': scale
-        } 
-        
-        return await self._get_img('emojimosaic', body)
-
-    async def flag(self, flag:str, images:List[str], opacity:int=128) -> PxlObject:
+    async def _get_text(self, enpoint:str, body) -> PxlObject:
         """
-        Turns the provided images into images with the flag specified
+        The function getting text, either from the cache or from pxlapi, sharing identical requests in flight if enabled. Not meant to be used outside of this class
 
         # Parameters:
-            `images (list)`: The images to proccess
-            `flag (string)`: The name of the flag to use
-            `opacity (int)`: What opacity to overlay the flag with
+            `endpoint (string)`: The endpoint to make the request to
+            `body (dictionary or bytes)`: The body of the request, it is encoded once here and the bytes are used from there on
 
         # Returns:
             `PxlObject`
         """
-        if not flag.lower() in self.flags:
-            if self.stop_on_error:
-                raise InvalidFlag(f'Flag {flag.lower()} not a valid flag')
+        if not isinstance(body, bytes):
+            try:
+                body = self.codec.dumps(body)
+            except Exception as e:
+                if self.stop_on_error:
+                    raise e
+                return PxlObject(success=False, error=f'Could not encode the body: {e}')
+        if self.text_cache is None and self.single_flight is None:
+            res = await self._post_text(enpoint, body)
+        else:
+            key = make_key(enpoint, body)
+            cached = self.text_cache.get(key) if self.text_cache is not None else None
+            if cached is not None:
+                res, fresh = cached
+                if not fresh:
+                    self.text_cache.refresh(key, enpoint, detached(lambda: self._fetch_text(key, enpoint, body)))
+            elif self.text_cache is not None:
+                res = await self._fetch_text(key, enpoint, body)
+                self.text_cache.put(key, enpoint, res)
             else:
-                return PxlObject(success=False, error=f'Flag {flag.lower()} not a valid flag')
+                res = await self._fetch_text(key, enpoint, body)
 
-        body = {
-            'images': images,
-            'opacity': opacity,
-        }
-        return await self._get_img(f'flag/{flag.lower()}', body)
-
-    async def ajit(self, images:List[str]) -> PxlObject:
-        """
-        Overlays an image of Ajit Pai snacking on some popcorn
+        if self.prefetcher is not None and res.success and enpoint == 'image_search' and isinstance(res.data, list):
+            self.prefetcher.schedule(self.transport, res.data)
+        return res
 
-        # Parameters:
-            `images (list)`: The images to proccess
-
-        # Returns:
-            `PxlObject`
+    async def _fetch_text(self, key:str, enpoint:str, body:bytes) -> PxlObject:
         """
-        body = {
-            'images': images
-        }
-        return await self._get_img('ajit', body)
-
-    async def flash(self, images:List[str]) -> PxlObject:
+        Makes the request for text, sharing it with identical requests in flight if enabled. Not meant to be used outside of this class
         """
-        Turns the provided images into flash images
+        if self.single_flight is None:
+            return await self._post_text(enpoint, body)
+        return await self.single_flight.do(key, detached(lambda: self._post_text(enpoint, body)))
 
-        # Parameters:
-            `images (list)`: The images to proccess
-
-        # Returns:
-            `PxlObject`
+    async def _post_text(self, enpoint:str, body:bytes) -> PxlObject:
         """
-        body = {
-            'images': images
-        }
-        return await self._get_img('flash', body)
-
-    async def glitch(self, images:List[str], delay:int=100, count:int=10, amount:int=5, iterations:int=10, gif:bool=None) -> PxlObject:
+        Makes the request for text once the scheduler lets it through, measuring it if metrics are enabled. Not meant to be used outside of this class
         """
-        Turns the provided images into images into glitch GIFs and/or images
+        def send():
+            if self.metrics is None:
+                return self._send_text(enpoint, body)
+            return self.metrics.observe(enpoint, body, self._send_text(enpoint, body))
 
-        # Parameters:
-            `images (list)`: The images to proccess
-            `delay (int)`: How long to display each frame for (in ms)
-            `count (int)`: How many frames to generate
-            `amount (int)`: Byte chunk length
-            `iterations (int)`: How many byte chunks to modify,
-            `gif (boolean)`: Additional information for glitching static images into a GIF
+        if self.breaker is not None and self.breaker.rejects(enpoint):
+            return self._reject(enpoint)
+        if self.scheduler is None:
+            return await send()
+        return await self.scheduler.run(send)
 
-        # Returns:
-            `PxlObject`
+    async def _send_text(self, enpoint:str, body:bytes) -> PxlObject:
         """
-        body = {
-            'images': images,
-            'delay': delay,
-            'count': count,
-            'amount': amount,
-            'iterations': iterations,
-            'gif': gif
-        }
-        return await self._get_img('glitch', body)
-
-    async def lego(self, images:List[str], scale:bool=False, groupSize:int=8) -> PxlObject:
-        """
-        Turns the provided images into images into images made up of lego bricks
-
-        # Parameters:
-            `images (list)`: The images to proccess
-            `scale (boolean)`: Whether to resize the resulting image to the original images dimensions
-            `groupSize (int)`: How big of a pixel square to group into one brick. Defaults to a 32x32 brick result
-
-        # Returns:
-            `PxlObject`
-        """
-        body = {
-            'images': images,
-            'scale': scale,
-            'groupSize': groupSize
-        }
-        return await self._get_img('lego', body)
-    
-    async def jpeg(self, images:List[str], quality:int=1) -> PxlObject:
-        """
-        Turns the provided images into lower quality
-
-        # Parameters:
-            `images (list)`: The images to proccess
-            `quality (int)`: What JPEG quality to encode the image as
-
-        # Returns:
-            `PxlObject`
-        """
-        body = {
-            'images': images,
-            'quality': quality
-        }
-        return await self._get_img('jpeg', body)
-
-    async def snapchat(self, filter:str, images:List[str], filters:list=None) -> PxlObject:
-        """
-        Turns the provided images into images with the snap filter provided if a face is detected
+        The function making the request which gets text in return. Not meant to be used outside of this class
 
         # Parameters:
-            `images (list)`: The images to proccess
-            `filter (string)`: The filter to apply
-            `filters (list)`: What filters to limit "random" to (defaults to all available filters)
+            `endpoint (string)`: The endpoint to make the request to
+            `body (bytes)`: The encoded body of the request
 
         # Returns:
             `PxlObject`
         """
-        if not filter.lower() in self.filters:
+        try:
+            r = await self._request(enpoint, body)
+        except Exception as e:
             if self.stop_on_error:
-                raise InvalidFilter(f'Flag {filter.lower()} not a valid filter')
-            else:
-                return PxlObject(success=False, error=f'Flag {filter.lower()} not a valid filter')
+                raise e
+            return PxlObject(success=False, error=str(e))
+        if r.status == 200:
+            raw = await r.read()
+            return PxlObject(data=self.codec.loads(raw), success=True, size=len(raw))
+        else:
+            error = str(await r.text())
+            if self.stop_on_error:
+                raise PxlapiException(error)
 
-        body = {
-            'images': images,
-            'filters': filters
-        }
-        return await self._get_img(f'snapchat/{filter}', body)
+            return PxlObject(error=error, success=False)
 
-    async def eyes(self, eyes:str, images:List[str], filters:list=None) -> PxlObject:
+    async def _call(self, endpoint:Endpoint, args:dict, sink=None, priority:int=0, tenant=None, deadline:float=None) -> PxlObject:
         """
-        Turns the provided images into images with a filter applied to the eyes of faces detected
+        Validates the arguments of an endpoint method and makes the request. Not meant to be used outside of this class
 
         # Parameters:
-            `images (list)`: The images to proccess
-            `eyes (string)`: The filter to apply
-            `filters (list)`: What filters to limit "random" to (defaults to all available filters)
+            `endpoint (Endpoint)`: The specification of the endpoint
+            `args (dictionary)`: The arguments the method was called with
+            `sink (file, path, file descriptor or writer)`: Where to stream the image to
+            `priority (int)`: The priority of the request for the scheduler
+            `tenant (hashable)`: Who the request is made for, for the scheduler
+            `deadline (float)`: How many seconds the call may take, defaults to the deadline of the client
 
         # Returns:
             `PxlObject`
         """
-        if not eyes.lower() in self.valid_eyes:
+        if deadline is None:
+            deadline = self.deadline
+        error = endpoint.validate(args)
+        if error is not None:
+            cls, message = error
             if self.stop_on_error:
-                raise InvalidEyes(f'Eye {eyes.lower()} not a valid eye type')
-            else:
-                return PxlObject(success=False, error=f'Eye {eyes.lower()} not a valid eye type')
+                raise cls(message)
+            return PxlObject(success=False, error=message)
 
-        body = {
-            'images': images,
-            'filters': filters
-        }
-        return await self._get_img(f'eyes/{eyes}', body)
+        images = args.get('images')
+        if images is not None and not all(isinstance(image, str) for image in images):
+            start = asyncio.get_running_loop().time()
+            try:
+                args['images'] = await prepare_images(images, self.preprocessor)
+            except Exception as e:
+                if self.stop_on_error:
+                    raise e
+                return PxlObject(success=False, error=f'Could not read image: {e}')
+            if deadline is not None:
+                deadline -= asyncio.get_running_loop().time() - start
 
-    async def thonkify(self, text:str) -> PxlObject:
-        """
-        Turns the provided text into an image with that text made up of thonks
+        path, body = endpoint.build(args, deadline)
+        return await self.request(path, body, endpoint.image, sink, priority=priority, tenant=tenant, deadline=deadline)
 
-        # Parameters:
-            `text (string)`: The text to thonkify
-
-        # Returns:
-            `PxlObject`
+    async def request(self, endpoint:str, body, image:bool=True, sink=None, *, priority:int=0, tenant=None, deadline:float=None) -> PxlObject:
         """
-        body = {
-            'text': text
-        }
-        return await self._get_img('thonkify', body)
-
-    async def sonic(self, text:str) -> PxlObject:
-        """
-        Turns the provided text into an image with sonic saying the provided text
+        Makes a request to any endpoint without validating it. Useful to send an already encoded body, e.g. a large `inject` for imagescript
+        which is reused between requests, so it is not encoded again for every request, retry and cache key
 
         # Parameters:
-            `text (string)`: The text to let sonic say
+            `endpoint (string)`: The endpoint to make the request to, e.g. `"imagescript/1.2.17"`
+            `body (dictionary or bytes)`: The body of the request, bytes are sent as they are
+            `image (boolean)`: Whether the endpoint returns an image (otherwise json)
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
 
         # Returns:
             `PxlObject`
         """
-        if len(text) > 1000:
-            if self.stop_on_error:
-                raise TooManyCharacters("Too many characters used for the sonic endpoint")
-            else:
-                return PxlObject(success=False, error="Too many characters used for the sonic endpoint")
+        if deadline is None:
+            deadline = self.deadline
+        if deadline is None:
+            return await self._dispatch(endpoint, body, image, sink, priority, tenant, None)
 
-        body = {
-            'text': text
-        }
-        return await self._get_img('sonic', body)
+        try:
+            return await asyncio.wait_for(self._dispatch(endpoint, body, image, sink, priority, tenant, deadline), max(deadline, 0))
+        except DeadlineExceeded:
+            raise
+        except asyncio.TimeoutError:
+            error = f'The request to {endpoint} did not finish within {deadline:g} seconds'
+            if self.stop_on_error:
+                raise DeadlineExceeded(error) from None
+            return PxlObject(success=False, error=error)
 
-    async def klines(self, pair:str=None, interval:str="1m", limit:int=90, ticks:List[int]=None, custom:dict=None):
+    async def _dispatch(self, endpoint:str, body, image:bool, sink, priority:int, tenant, deadline:float) -> PxlObject:
         """
-        Creates a candlestick chart for the given coin pair / ticks
-
-        # Parameters:
-            `pair (string)`: The [coin pair](https://www.binance.com/api/v3/exchangeInfo) to generate a candlestick chart for (e.g. `BNBBUSD`). Optional if custom ticks are sent.
-            `interval (string)`: Timespan between candlesticks
-            `limit (int)`: How many candlesticks to draw
-            `ticks (list)`: Custom ticks (lets you send in [binance API compatible](https://github.com/binance/binance-spot-api-docs/blob/master/rest-api.md#klinecandlestick-data) tick data)
-            `custom (dict)`: Custom pair data to display
-                key `baseAsset (string)`: Custom base asset name to display
-                value `quoteAsset (string)`: Custom quote asset name to display
-        
-        # Returns:
-            `PxlObject`
+        Makes the request with the priority, tenant and deadline of the call known to everything it leads to. Not meant to be used outside of this class
         """
-        body = {
-            "interval": interval,
-            "limit": limit,
-            "ticks": ticks,
-            "pair": pair,
-        }
-        return await self._get_img(f"klines{f'/{pair}' if pair else ''}", body)
+        token = current_call.set((priority, tenant)) if self.scheduler is not None else None
+        deadline_token = call_deadline.set(asyncio.get_running_loop().time() + deadline) if deadline is not None else None
+        try:
+            if image:
+                return await self._get_img(endpoint, body, sink)
+            return await self._get_text(endpoint, body)
+        finally:
+            if token is not None:
+                current_call.reset(token)
+            if deadline_token is not None:
+                call_deadline.reset(deadline_token)
 
-    async def imagescript(self, version:str, code:str, inject=None, timeout:int=10000) -> PxlObject:
+    async def map(self, method, kwargs:Iterable[dict], concurrency:int=8, ordered:bool=False) -> AsyncIterator[PxlObject]:
         """
-        Evaluates code 
+        Calls one method for every set of keyword arguments with a limited amount of requests in flight, yielding results as they come in.
+        Arguments are only taken from `kwargs` when there is room for another request, so it can be a lazy generator of any length.
+        If `stop_on_error` is enabled the first error is raised and all requests still in flight are cancelled
 
         # Parameters:
-            `version (string)`: The version of imagescript to use
-            `code (string)`: The code to evaluate
-            `inject (object)`: The data to inject as global variables
-            `timeout (int)`: Maximum run time in ms
+            `method (string or method)`: The method to call, e.g. `"flag"` or `pxl.flag`
+            `kwargs (iterable)`: The keyword arguments for each call, e.g. `({"flag": "trans", "images": [url]} for url in urls)`
+            `concurrency (int)`: How many requests may be in flight at once
+            `ordered (boolean)`: Whether to yield results in the order of `kwargs` instead of the order they complete in
 
         # Returns:
-            `PxlObject`
-        """
-        body = {
-            'code': code,
-            'inject': inject,
-            'timeout': timeout
-        }
-        return await self._get_img(f'imagescript/{version}', body)
+            An async iterator of `PxlObject`
+
+        # Example:
+            ```py
+            async for res in pxl.map("glitch", ({"images": [url]} for url in urls), concurrency=16):
+                ...
+            ```
+        """
+        if isinstance(method, str):
+            method = getattr(self, method)
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        arguments = iter(kwargs)
+        exhausted = False
+        pending = set()
+        positions = {}
+        finished = {} # Results which completed before the ones preceding them, only used if ordered
+        started = 0
+        next_position = 0
 
-    async def imagescript_version(self) -> PxlObject:
-        """
-        Gives you the available versions for imagescript
+        try:
+            while True:
+                # With ordered results, buffered results count towards the limit so memory stays bounded
+                while not exhausted and len(pending) + len(finished) < concurrency:
+                    try:
+                        kw = next(arguments)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    task = asyncio.ensure_future(method(**kw))
+                    positions[task] = started
+                    pending.add(task)
+                    started += 1
+
+                if not pending:
+                    return
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=positions.get):
+                    position = positions.pop(task)
+                    if ordered:
+                        finished[position] = task.result()
+                    else:
+                        yield task.result()
+
+                while next_position in finished:
+                    yield finished.pop(next_position)
+                    next_position += 1
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stream(self, method, **kwargs) -> ChunkStream:
+        """
+        Calls an image method and yields the image in chunks while it is received, without keeping all of it in memory.
+        Once exhausted, the `result` property holds the `PxlObject` of the request
 
         # Parameters:
-            None
+            `method (string or method)`: The image method to call, e.g. `"glitch"` or `pxl.glitch`
+            `kwargs`: The arguments of the method
 
         # Returns:
-            `PxlObject`
-        """
-        body = {}
-        return await self._get_text('imagescript/versions', body)
-
-    async def image_search(self, query:str, safeSearch:str='strict', meta:bool=False) -> PxlObject:
-        """
-        Looks for images with provided query
+            `ChunkStream`, an async iterator of `bytes`
 
-        # Parameters:
-            `query (string)`: What to search for
-            `safeSearch (string)`: What safe search setting to use
-            `meta (boolean)`: Whether to return meta data (page title and URL)
-
-        # Returns:
-            `PxlObject`
+        # Example:
+            ```py
+            async for chunk in pxl.stream("glitch", images=[url]):
+                await writer.write(chunk)
+            ```
         """
-        if len(query) > 128:
-            if self.stop_on_error:
-                raise TooManyCharacters("Too many characters used for the image_search endpoint")
-            else:
-                return PxlObject(success=False, error="Too many characters used for the image_search endpoint")
-        if not safeSearch.lower() in self.safe_search:
-            if self.stop_on_error:
-                raise InvalidSafety("Invalid safety level for the image_search endpoint")
-            else:
-                return PxlObject(success=False, error="Invalid safety level for the image_search endpoint")
-
-        body = {
-            'query': query,
-            'safeSearch': safeSearch,
-            'meta': meta
-        }
-        return await self._get_text('image_search', body)
+        if isinstance(method, str):
+            method = getattr(self, method)
+        return ChunkStream(method, kwargs)
 
-    async def screenshot(self, url:str, device:str=None, locale:str='en_US', blocklist:list=[], defaultBlocklist:bool=True, browser:str='chromium', theme:str='dark', timeout:int=30000, fullPage:bool=False) -> PxlObject:
+    async def download(self, url:str) -> PxlObject:
         """
-        Screenshots the webpage provided
+        Downloads an image, e.g. a result of `image_search`. With a `prefetcher` it is served from there if it was prefetched
 
         # Parameters:
-            `url (string) -> PxlObject: The website to screenshot
-            `device (string)`: The device to emulate. See [list of available devices](https://github.com/microsoft/playwright/blob/17e953c2d8bd19ace20059ffaaa85f3f23cfb19d/src/server/deviceDescriptors.js#L21-L857). Defaults to a non-specific browser with a viewport of 1920x1080 pixels.
-            `locale (string)`: The locale to set the browser to
-            `blocklist (list)`: A list of domains to block
-            `defaultBlocklist (boolean)`: Whether to block a list of predefined, known-bad domains (e.g. NSFW content)
-            `browser (string)`: What browser engine to use for screenshotting
-            `theme (string)`: What theme to use
-            `timout (int)`: The max time to wait until the site has loaded (in ms)
-            `fullPage (boolean)`: Whether to capture the entire page
+            `url (string)`: The url of the image
 
         # Returns:
             `PxlObject`
         """
-        body = {
-            'url': url,
-            'device': device,
-            'locale': locale,
-            'blocklist': blocklist,
-            'defaultBlocklist': defaultBlocklist,
-            'browser': browser,
-            'theme': theme,
-            'timeout': timeout
-        }
-        return await self._get_img('screenshot', body)
+        if self.prefetcher is None:
+            self.prefetcher = Prefetcher(top=0) # Only keeps what is downloaded here
+        res = await self.prefetcher.fetch(self.transport, url)
+        if not res.success and self.stop_on_error:
+            raise PxlapiException(res.error)
+        return res
 
-    async def web_search(self, query:str, safeSearch:str='strict') -> PxlObject:
+    def pipeline(self, images:list=None, cache:ImageCache=None) -> Pipeline:
         """
-        Searches for the querie provided
+        Creates a pipeline chaining image methods, which sends the output of each stage inline to the next ones
 
         # Parameters:
-            `url (string) -> PxlObject: The website to screenshot
-            `safeSearch (string)`: What safe search setting to use
+            `images (list)`: The images stages without inputs start from
+            `cache (ImageCache)`: Where to keep intermediate results between runs, defaults to `cache`
 
         # Returns:
-            `PxlObject`
-        """
-        if len(query) > 128:
-            if self.stop_on_error:
-                raise TooManyCharacters("Too many characters used for the web_search endpoint")
-            else:
-                return PxlObject(success=False, error="Too many characters used for the web_search endpoint")
-        if not safeSearch.lower() in self.safe_search:
-            if self.stop_on_error:
-                raise InvalidSafety("Invalid safety level for the web_search endpoint")
-            else:
-                return PxlObject(success=False, error="Invalid safety level for the web_search endpoint")
+            `Pipeline`
 
-        body = {
-            'query': query,
-            'safeSearch': safeSearch
-        }
-        return await self._get_text('web_search', body)
\ No newline at end of file
+        # Example:
+            ```py
+            pipe = pxl.pipeline(images=[url])
+            glitched = pipe.stage("glitch", pipe.stage("jpeg"))
+            res = await pipe.run()
+            await ctx.send(file=discord.File(res[glitched].convert_to_ioBytes(), "glitch.gif"))
+            ```
+        """
+        return Pipeline(self, images, cache)
@@ -0,0 +1,57 @@
+import asyncio
+
+class SingleFlight:
+    """
+    Lets concurrent calls with the same key share one in-flight request instead of each making their own
+
+    # Properties:
+        calls (int): How many calls went through this object
+        deduplicated (int): How many of those calls joined a request that was already in flight
+        in_flight (int): How many requests are currently in flight
+
+    # Methods:
+        `do(key, factory)`
+            Awaits the request in flight for `key` or starts one by calling `factory`
+    """
+    def __init__(self):
+        self.calls = 0
+        self.deduplicated = 0
+        self._in_flight = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def _done(self, key, task:asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception() # Marks the exception as retrieved in case every caller was cancelled
+
+    async def do(self, key, factory):
+        """
+        Awaits the shared request for `key`. Cancelling a caller does not cancel the shared request
+
+        # Parameters:
+            `key (hashable)`: What identifies identical requests
+            `factory (callable)`: Returns the coroutine making the request if none is in flight
+
+        # Returns:
+            Whatever the coroutine returns
+        """
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            self.deduplicated += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {
+            'calls': self.calls,
+            'deduplicated': self.deduplicated,
+            'in_flight': self.in_flight
+        }
@@ -0,0 +1,102 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+class JsonCodec:
+    """
+    Encodes request bodies and decodes responses using the standard library `json` module.
+    Keys are sorted, so equal bodies always encode to the same bytes and share a cache key
+
+    # Properties:
+        name (string): Which library the codec uses
+
+    # Methods:
+        `dumps(obj)`
+            Encodes an object to utf-8 json bytes
+        `loads(data)`
+            Decodes json bytes
+    """
+    name = 'json'
+
+    def dumps(self, obj) -> bytes:
+        try:
+            return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, sort_keys=True).encode()
+        except TypeError: # Keys of different types can not be sorted
+            return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+    def loads(self, data:bytes):
+        return json.loads(data)
+
+class OrjsonCodec(JsonCodec):
+    """
+    Encodes and decodes json using `orjson`. What orjson does not support, e.g. integers over 64 bits, falls back to the standard library
+    """
+    name = 'orjson'
+
+    def dumps(self, obj) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS)
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, data:bytes):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(data)
+
+class UjsonCodec(JsonCodec):
+    """
+    Encodes and decodes json using `ujson`. What ujson does not support, e.g. integers over 64 bits, falls back to the standard library
+    """
+    name = 'ujson'
+
+    def dumps(self, obj) -> bytes:
+        try:
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False, sort_keys=True).encode()
+        except (TypeError, OverflowError):
+            return super().dumps(obj)
+
+    def loads(self, data:bytes):
+        try:
+            return ujson.loads(data)
+        except ValueError:
+            return super().loads(data)
+
+CODECS = {
+    'json': JsonCodec,
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec
+}
+
+def get_codec(codec='auto') -> JsonCodec:
+    """
+    Returns a json codec
+
+    # Parameters:
+        `codec (string or JsonCodec)`: `"orjson"`, `"ujson"`, `"json"` or `"auto"` for the fastest one installed. A `JsonCodec` is returned as is
+
+    # Returns:
+        `JsonCodec`
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == 'auto':
+        if orjson is not None:
+            return OrjsonCodec()
+        if ujson is not None:
+            return UjsonCodec()
+        return JsonCodec()
+    if (codec == 'orjson' and orjson is None) or (codec == 'ujson' and ujson is None):
+        raise ImportError(f"{codec} is not installed")
+    if codec not in CODECS:
+        raise ValueError(f"Unknown json codec {codec}")
+    return CODECS[codec]()
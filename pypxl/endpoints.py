@@ -0,0 +1,281 @@
+"""
+The specification of every pxlapi endpoint. `PxlClient` generates its public methods from `ENDPOINTS`,
+so adding an endpoint only means adding an entry here
+"""
+from typing import List
+
+from .errors import InvalidFlag, InvalidFilter, InvalidEyes, TooManyCharacters, InvalidSafety
+from .pxl_object import PxlObject
+from .preprocess import ImageInput
+
+FLAGS = ("asexual", "aromantic", "bisexual", "pansexual", "gay", "lesbian", "trans", "nonbinary", "genderfluid", "genderqueer", "polysexual", "austria", "belgium", "botswana", "bulgaria", "ivory", "estonia", "france", "gabon", "gambia", "germany", "guinea", "hungary", "indonesia", "ireland", "italy", "luxembourg", "monaco", "nigeria", "poland", "russia", "romania", "sierraleone", "thailand", "ukraine", "yemen")
+FILTERS = ("dog", "dog2", "dog3", "pig", "flowers", "clown", "random")
+SAFE_SEARCH = ("off", "moderate", "strict")
+EYES = ("big", "black", "bloodshot", "blue", "default", "googly", "green", "horror", "illuminati", "money", "pink", "red", "small", "spinner", "spongebob", "white", "yellow", "random")
+
+REQUIRED = object()
+
+class Param:
+    """
+    A parameter of an endpoint method
+
+    # Parameters:
+        `name (string)`: The name of the parameter, also used as the key in the body
+        `annotation (type)`: The type annotation of the parameter
+        `description (string)`: What the parameter does, shown in the docstring as `name (kind)`: description
+
+    # Optional parameters:
+        `default`: The default value, the parameter is required if omitted
+        `kind (string)`: The type name shown in the docstring
+    """
+    __slots__ = ('name', 'annotation', 'description', 'default', 'kind')
+
+    def __init__(self, name:str, annotation, description:str, default=REQUIRED, kind:str=None):
+        self.name = name
+        self.annotation = annotation
+        self.description = description
+        self.default = default
+        self.kind = kind or {str: 'string', int: 'int', bool: 'boolean', dict: 'dict', list: 'list'}.get(annotation, 'list' if annotation == List[str] else 'object')
+
+class OneOf:
+    """
+    Validates that a parameter is one of the allowed choices, lowercasing it in place first
+    """
+    __slots__ = ('name', 'choices', 'error', 'message')
+
+    def __init__(self, name:str, choices:tuple, error:type, message:str):
+        self.name = name
+        self.choices = frozenset(choices)
+        self.error = error
+        self.message = message
+
+    def __call__(self, args:dict) -> tuple:
+        value = args[self.name] = args[self.name].lower()
+        if value not in self.choices:
+            return self.error, self.message.format(value)
+
+class MaxLength:
+    """
+    Validates that a parameter is not longer than `limit` characters
+    """
+    __slots__ = ('name', 'limit', 'error', 'message')
+
+    def __init__(self, name:str, limit:int, error:type, message:str):
+        self.name = name
+        self.limit = limit
+        self.error = error
+        self.message = message
+
+    def __call__(self, args:dict) -> tuple:
+        if len(args[self.name]) > self.limit:
+            return self.error, self.message
+
+class Endpoint:
+    """
+    The specification of one pxlapi endpoint and the client method calling it
+
+    # Parameters:
+        `name (string)`: The name of the generated method
+        `path (string or callable)`: The path of the endpoint, or a function returning it from the arguments
+        `description (string)`: The first line of the docstring
+        `params (tuple)`: The `Param`s of the method in order
+
+    # Optional parameters:
+        `image (boolean)`: Whether the endpoint returns an image (otherwise json)
+        `body (tuple)`: The names of the params sent in the body, defaults to all params not used in a path template
+        `validators (tuple)`: Callables taking the arguments and returning `(error class, message)` if they are invalid
+        `defaults (dictionary)`: Values to send in the body if the argument is None
+        `timeout (string)`: The body field holding how many ms pxlapi may work on the request, it is capped at the deadline of the call when the body is built. Retries send the same body
+    """
+    __slots__ = ('name', 'path', 'description', 'params', 'image', 'body', 'validators', 'defaults', 'timeout', 'static_path')
+
+    def __init__(self, name:str, path, description:str, params:tuple=(), image:bool=True, body:tuple=None, validators:tuple=(), defaults:dict=None, timeout:str=None):
+        self.name = name
+        self.path = path
+        self.description = description
+        self.params = params
+        self.image = image
+        self.body = tuple(p.name for p in params) if body is None else body
+        self.validators = validators
+        self.defaults = defaults or {}
+        self.timeout = timeout
+        self.static_path = path if isinstance(path, str) else None
+
+    def validate(self, args:dict) -> tuple:
+        """
+        Runs the validators, which may normalize the arguments in place
+
+        # Returns:
+            `(error class, message)` of the first failed validator or None
+        """
+        for validator in self.validators:
+            error = validator(args)
+            if error is not None:
+                return error
+
+    def build(self, args:dict, deadline:float=None) -> tuple:
+        """
+        Creates the path and body of a request from validated arguments
+
+        # Parameters:
+            `args (dictionary)`: The arguments
+            `deadline (float)`: How many seconds the caller waits for the response, pxlapi is not given more time than that
+
+        # Returns:
+            `(path, body)`
+        """
+        path = self.static_path or self.path(args)
+        body = {name: args[name] for name in self.body}
+        for name, default in self.defaults.items():
+            if body[name] is None:
+                body[name] = default
+        if deadline is not None and self.timeout is not None:
+            budget = int(deadline * 1000)
+            if body[self.timeout] is None or body[self.timeout] > budget:
+                body[self.timeout] = budget
+        return path, body
+
+    def docstring(self) -> str:
+        lines = [self.description, '', '# Parameters:']
+        lines.extend(f'    `{p.name} ({p.kind})`: {p.description}' for p in self.params)
+        if self.image:
+            lines.append('    `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory')
+        lines.append('    `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`')
+        lines.append('    `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants')
+        lines.append('    `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client')
+        lines.extend(('', '# Returns:', '    `PxlObject`'))
+        return '\n'.join(lines)
+
+def create_method(endpoint:Endpoint):
+    """
+    Creates the client method of an endpoint with a real signature, so calling it costs no more than a hand written method
+
+    # Parameters:
+        `endpoint (Endpoint)`: The endpoint to create the method for
+
+    # Returns:
+        `coroutine function`
+    """
+    namespace = {'_endpoint': endpoint}
+    params = []
+    for p in endpoint.params:
+        if p.default is REQUIRED:
+            params.append(p.name)
+        else:
+            namespace[f'_default_{p.name}'] = p.default
+            params.append(f'{p.name}=_default_{p.name}')
+    args = ', '.join(f"'{p.name}': {p.name}" for p in endpoint.params)
+    if endpoint.image:
+        params.append('sink=None')
+        call = f'self._call(_endpoint, {{{args}}}, sink, priority, tenant, deadline)'
+    else:
+        call = f'self._call(_endpoint, {{{args}}}, None, priority, tenant, deadline)'
+    params.extend(('*', 'priority=0', 'tenant=None', 'deadline=None'))
+
+    source = f"async def {endpoint.name}(self, {', '.join(params)}):\n    return await {call}\n"
+    exec(source, namespace)
+    method = namespace[endpoint.name]
+    method.__doc__ = endpoint.docstring()
+    method.__qualname__ = f'PxlClient.{endpoint.name}'
+    method.__module__ = 'pypxl.client'
+    method.__annotations__ = {p.name: p.annotation for p in endpoint.params}
+    method.__annotations__['return'] = PxlObject
+    return method
+
+IMAGES = Param('images', List[ImageInput], 'The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests', kind='list')
+
+ENDPOINTS = (
+    Endpoint('emojaic', 'emojimosaic', 'Turns the provided images into images assebled by emojis', (
+        IMAGES,
+        Param('groupSize', int, 'The group size', 12),
+        Param('scale', bool, 'To have the returned image at the same scale or not', False)
+    )),
+    Endpoint('flag', lambda args: f"flag/{args['flag']}", 'Turns the provided images into images with the flag specified', (
+        Param('flag', str, 'The name of the flag to use'),
+        IMAGES,
+        Param('opacity', int, 'What opacity to overlay the flag with', 128)
+    ), body=('images', 'opacity'), validators=(
+        OneOf('flag', FLAGS, InvalidFlag, 'Flag {} not a valid flag'),
+    )),
+    Endpoint('ajit', 'ajit', 'Overlays an image of Ajit Pai snacking on some popcorn', (IMAGES,)),
+    Endpoint('flash', 'flash', 'Turns the provided images into flash images', (IMAGES,)),
+    Endpoint('glitch', 'glitch', 'Turns the provided images into images into glitch GIFs and/or images', (
+        IMAGES,
+        Param('delay', int, 'How long to display each frame for (in ms)', 100),
+        Param('count', int, 'How many frames to generate', 10),
+        Param('amount', int, 'Byte chunk length', 5),
+        Param('iterations', int, 'How many byte chunks to modify', 10),
+        Param('gif', bool, 'Additional information for glitching static images into a GIF', None)
+    )),
+    Endpoint('lego', 'lego', 'Turns the provided images into images into images made up of lego bricks', (
+        IMAGES,
+        Param('scale', bool, 'Whether to resize the resulting image to the original images dimensions', False),
+        Param('groupSize', int, 'How big of a pixel square to group into one brick. Defaults to a 32x32 brick result', 8)
+    )),
+    Endpoint('jpeg', 'jpeg', 'Turns the provided images into lower quality', (
+        IMAGES,
+        Param('quality', int, 'What JPEG quality to encode the image as', 1)
+    )),
+    Endpoint('snapchat', lambda args: f"snapchat/{args['filter']}", 'Turns the provided images into images with the snap filter provided if a face is detected', (
+        Param('filter', str, 'The filter to apply'),
+        IMAGES,
+        Param('filters', list, 'What filters to limit "random" to (defaults to all available filters)', None)
+    ), body=('images', 'filters'), validators=(
+        OneOf('filter', FILTERS, InvalidFilter, 'Filter {} not a valid filter'),
+    )),
+    Endpoint('eyes', lambda args: f"eyes/{args['eyes']}", 'Turns the provided images into images with a filter applied to the eyes of faces detected', (
+        Param('eyes', str, 'The filter to apply'),
+        IMAGES,
+        Param('filters', list, 'What filters to limit "random" to (defaults to all available filters)', None)
+    ), body=('images', 'filters'), validators=(
+        OneOf('eyes', EYES, InvalidEyes, 'Eye {} not a valid eye type'),
+    )),
+    Endpoint('thonkify', 'thonkify', 'Turns the provided text into an image with that text made up of thonks', (
+        Param('text', str, 'The text to thonkify'),
+    )),
+    Endpoint('sonic', 'sonic', 'Turns the provided text into an image with sonic saying the provided text', (
+        Param('text', str, 'The text to let sonic say'),
+    ), validators=(
+        MaxLength('text', 1000, TooManyCharacters, 'Too many characters used for the sonic endpoint'),
+    )),
+    Endpoint('klines', lambda args: f"klines/{args['pair']}" if args['pair'] else 'klines', 'Creates a candlestick chart for the given coin pair / ticks', (
+        Param('pair', str, 'The [coin pair](https://www.binance.com/api/v3/exchangeInfo) to generate a candlestick chart for (e.g. `BNBBUSD`). Optional if custom ticks are sent.', None),
+        Param('interval', str, 'Timespan between candlesticks', '1m'),
+        Param('limit', int, 'How many candlesticks to draw', 90),
+        Param('ticks', List[int], 'Custom ticks (lets you send in [binance API compatible](https://github.com/binance/binance-spot-api-docs/blob/master/rest-api.md#klinecandlestick-data) tick data)', None, 'list'),
+        Param('custom', dict, 'Custom pair data to display\n        key `baseAsset (string)`: Custom base asset name to display\n        value `quoteAsset (string)`: Custom quote asset name to display', None)
+    )),
+    Endpoint('imagescript', lambda args: f"imagescript/{args['version']}", 'Evaluates code', (
+        Param('version', str, 'The version of imagescript to use'),
+        Param('code', str, 'The code to evaluate'),
+        Param('inject', object, 'The data to inject as global variables', None),
+        Param('timeout', int, 'Maximum run time in ms', 10000)
+    ), body=('code', 'inject', 'timeout'), timeout='timeout'),
+    Endpoint('imagescript_version', 'imagescript/versions', 'Gives you the available versions for imagescript', image=False),
+    Endpoint('image_search', 'image_search', 'Looks for images with provided query', (
+        Param('query', str, 'What to search for'),
+        Param('safeSearch', str, 'What safe search setting to use', 'strict'),
+        Param('meta', bool, 'Whether to return meta data (page title and URL)', False)
+    ), image=False, validators=(
+        MaxLength('query', 128, TooManyCharacters, 'Too many characters used for the image_search endpoint'),
+        OneOf('safeSearch', SAFE_SEARCH, InvalidSafety, 'Invalid safety level for the image_search endpoint')
+    )),
+    Endpoint('screenshot', 'screenshot', 'Screenshots the webpage provided', (
+        Param('url', str, 'The website to screenshot'),
+        Param('device', str, 'The device to emulate. See [list of available devices](https://github.com/microsoft/playwright/blob/17e953c2d8bd19ace20059ffaaa85f3f23cfb19d/src/server/deviceDescriptors.js#L21-L857). Defaults to a non-specific browser with a viewport of 1920x1080 pixels.', None),
+        Param('locale', str, 'The locale to set the browser to', 'en_US'),
+        Param('blocklist', list, 'A list of domains to block', None),
+        Param('defaultBlocklist', bool, 'Whether to block a list of predefined, known-bad domains (e.g. NSFW content)', True),
+        Param('browser', str, 'What browser engine to use for screenshotting', 'chromium'),
+        Param('theme', str, 'What theme to use', 'dark'),
+        Param('timeout', int, 'The max time to wait until the site has loaded (in ms)', 30000),
+        Param('fullPage', bool, 'Whether to capture the entire page', False)
+    ), defaults={'blocklist': []}, timeout='timeout'),
+    Endpoint('web_search', 'web_search', 'Searches for the query provided', (
+        Param('query', str, 'What to search for'),
+        Param('safeSearch', str, 'What safe search setting to use', 'strict')
+    ), image=False, validators=(
+        MaxLength('query', 128, TooManyCharacters, 'Too many characters used for the web_search endpoint'),
+        OneOf('safeSearch', SAFE_SEARCH, InvalidSafety, 'Invalid safety level for the web_search endpoint')
+    ))
+)
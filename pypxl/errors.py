@@ -1,3 +1,5 @@
+import asyncio
+
 class PxlapiException(Exception):
     """
     The base exception for anything related to pypxl
@@ -26,4 +28,16 @@ class PxlObjectError(PxlapiException):
     pass
 
 class InvalidBytes(PxlObjectError):
-    pass
\ No newline at end of file
+    pass
+
+class CircuitOpen(PxlapiException):
+    """
+    Raised when requests to an endpoint are failing fast because it failed too often recently
+    """
+    pass
+
+class DeadlineExceeded(PxlapiException, asyncio.TimeoutError):
+    """
+    Raised when a request did not finish within its deadline
+    """
+    pass
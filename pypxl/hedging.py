@@ -0,0 +1,112 @@
+import asyncio
+import time
+from collections import deque
+
+from .cache import is_deterministic
+from .pxl_object import PxlObject
+
+class HedgePolicy:
+    """
+    Sends a duplicate of a request which has not completed after a delay and uses whichever response arrives first, cancelling the other.
+    Only requests to deterministic endpoints are hedged, since both responses have to be interchangeable
+
+    # Optional parameters:
+        `delay (float)`: How many seconds to wait before hedging. If None the observed `quantile` of the endpoint's latency is used
+        `quantile (float)`: Which latency quantile to hedge after if no fixed delay is set
+        `min_samples (int)`: How many requests to an endpoint have to be observed before hedging after its quantile
+        `window (int)`: How many of the latest latencies per endpoint to compute the quantile from
+        `budget (float)`: The share of requests which may be hedged at most, e.g. 0.05 for 5% extra load
+        `endpoints (iterable)`: Which endpoints to hedge, e.g. `("flag", "jpeg", "lego")`. Defaults to all deterministic endpoints
+
+    # Properties:
+        requests (int): How many requests could have been hedged
+        hedged (int): How many requests were hedged
+        wins (int): How many hedged requests were answered by the duplicate first
+    """
+    def __init__(self, delay:float=None, quantile:float=0.95, min_samples:int=20, window:int=200, budget:float=0.05, endpoints=None):
+        self.delay = delay
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.window = window
+        self.budget = budget
+        self.endpoints = frozenset(endpoints) if endpoints is not None else None
+        self.requests = 0
+        self.hedged = 0
+        self.wins = 0
+        self._latencies = {}
+        self._delays = {}
+
+    def eligible(self, endpoint:str) -> bool:
+        if not is_deterministic(endpoint, None):
+            return False
+        return self.endpoints is None or endpoint.split('/')[0] in self.endpoints
+
+    def _observe(self, name:str, seconds:float) -> None:
+        latencies = self._latencies.get(name)
+        if latencies is None:
+            latencies = self._latencies[name] = deque(maxlen=self.window)
+        latencies.append(seconds)
+        if len(latencies) >= self.min_samples and len(latencies) % 10 == 0: # Sorting on every request is not worth it
+            ordered = sorted(latencies)
+            self._delays[name] = ordered[min(len(ordered) - 1, int(self.quantile * len(ordered)))]
+
+    def delay_for(self, endpoint:str) -> float:
+        """
+        How long to wait before hedging a request to `endpoint`
+
+        # Returns:
+            `float` or None if not enough requests were observed yet
+        """
+        if self.delay is not None:
+            return self.delay
+        return self._delays.get(endpoint.split('/')[0])
+
+    async def run(self, endpoint:str, factory) -> PxlObject:
+        """
+        Makes a request, hedging it if it takes longer than the delay and the budget allows it
+
+        # Parameters:
+            `endpoint (string)`: The endpoint the request is made to
+            `factory (callable)`: Returns a coroutine making the request, called once more for the duplicate
+
+        # Returns:
+            `PxlObject`
+        """
+        name = endpoint.split('/')[0]
+        self.requests += 1
+        delay = self.delay_for(endpoint)
+        start = time.perf_counter()
+        first = asyncio.ensure_future(factory())
+        tasks = {first}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or self.hedged >= self.budget * self.requests:
+                res = await first
+                if res.success: # Fast errors would pull the delay down and hedge healthy requests too early
+                    self._observe(name, time.perf_counter() - start)
+                return res
+
+            self.hedged += 1
+            hedge_start = time.perf_counter()
+            second = asyncio.ensure_future(factory())
+            tasks.add(second)
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and task.result().success:
+                        if task is second:
+                            self.wins += 1
+                        self._observe(name, time.perf_counter() - (hedge_start if task is second else start))
+                        return task.result()
+                if not tasks: # Both failed, report the failure of the original request
+                    return first.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def stats(self) -> dict:
+        return {
+            'requests': self.requests,
+            'hedged': self.hedged,
+            'wins': self.wins
+        }
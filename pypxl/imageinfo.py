@@ -0,0 +1,328 @@
+import struct
+import zlib
+from typing import Iterator
+
+from .errors import InvalidBytes
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# Start of frame markers, the others in 0xC0 - 0xCF are DHT, JPG and DAC
+JPEG_SOF = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+class ImageInfo:
+    """
+    The metadata of an image, read from its container without decoding any pixels
+
+    # Properties:
+        format (string): `gif`, `png` or `jpeg`
+        width (int): The width of the image (the logical screen for GIFs)
+        height (int): The height of the image
+        frame_count (int): How many frames the image has
+        durations (tuple): How long each frame is shown in ms, empty for still images
+        loop (int): How often an animation is played, 0 for forever and None if it is not animated or the image does not say
+        animated (boolean): Whether the image has more than one frame
+        duration (int): How long the animation is in ms
+    """
+    __slots__ = ('format', 'width', 'height', 'frame_count', 'durations', 'loop')
+
+    def __init__(self, format:str, width:int, height:int, frame_count:int=1, durations:tuple=(), loop:int=None):
+        self.format = format
+        self.width = width
+        self.height = height
+        self.frame_count = frame_count
+        self.durations = durations
+        self.loop = loop
+
+    @property
+    def animated(self) -> bool:
+        return self.frame_count > 1
+
+    @property
+    def duration(self) -> int:
+        return sum(self.durations)
+
+    def __repr__(self) -> str:
+        return f'<ImageInfo {self.format} {self.width}x{self.height} frames={self.frame_count}>'
+
+class Frame:
+    """
+    One frame of an image. `data` is a view of the part of the original buffer holding the frame, nothing is copied until `to_bytes()` is called
+
+    # Properties:
+        index (int): The position of the frame
+        x (int): The horizontal offset of the frame on the canvas
+        y (int): The vertical offset of the frame on the canvas
+        width (int): The width of the frame
+        height (int): The height of the frame
+        duration (int): How long the frame is shown in ms, None for still images
+        disposal (int): What happens to the canvas after the frame is shown, as defined by the format
+        data (memoryview): The blocks or chunks of the frame in the original buffer
+
+    # Methods:
+        `to_bytes()`
+            Builds a standalone still image of the frame in the format of the original. Only the frame itself is in it, it is not drawn over the frames before it
+    """
+    __slots__ = ('index', 'x', 'y', 'width', 'height', 'duration', 'disposal', 'data', '_build')
+
+    def __init__(self, index:int, x:int, y:int, width:int, height:int, duration:int, disposal:int, data:memoryview, build):
+        self.index = index
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.duration = duration
+        self.disposal = disposal
+        self.data = data
+        self._build = build
+
+    def to_bytes(self) -> bytes:
+        return self._build(self)
+
+    def __repr__(self) -> str:
+        return f'<Frame {self.index} {self.width}x{self.height}+{self.x}+{self.y} duration={self.duration}>'
+
+def _view(buffer) -> memoryview:
+    view = memoryview(buffer).cast('B')
+    return view if view.readonly else view.toreadonly()
+
+def _format(view:memoryview) -> str:
+    head = bytes(view[:8])
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return 'gif'
+    if head == PNG_SIGNATURE:
+        return 'png'
+    if head[:3] == b'\xff\xd8\xff':
+        return 'jpeg'
+    raise InvalidBytes("The image is not a GIF, PNG or JPEG")
+
+def _truncated(format:str) -> InvalidBytes:
+    return InvalidBytes(f"The {format} image is truncated or corrupt")
+
+# GIF
+
+def _skip_sub_blocks(view:memoryview, pos:int) -> int:
+    size = view[pos]
+    while size:
+        pos += size + 1
+        size = view[pos]
+    return pos + 1
+
+def _gif_screen(view:memoryview) -> tuple:
+    try:
+        width, height, packed = struct.unpack_from('<HHB', view, 6)
+    except struct.error:
+        raise _truncated('gif') from None
+    palette = 3 << ((packed & 7) + 1) if packed & 0x80 else 0
+    return width, height, 13 + palette
+
+def _gif_frames(view:memoryview, info:ImageInfo=None) -> Iterator[Frame]:
+    _, _, pos = _gif_screen(view)
+    header = view[:pos] # Signature, logical screen descriptor and global color table
+
+    def build(frame:Frame) -> bytes:
+        return b''.join((header, frame.data, b';'))
+
+    index = 0
+    start = None # Where the graphic control extension of the next frame starts
+    delay = None
+    disposal = 0
+    try:
+        while True:
+            block = view[pos]
+            if block == 0x3B: # Trailer
+                return
+            if block == 0x21: # Extension
+                label = view[pos + 1]
+                if label == 0xF9: # Graphic control extension
+                    start = pos
+                    packed, delay = struct.unpack_from('<BH', view, pos + 3)
+                    disposal = (packed >> 2) & 7
+                    delay *= 10
+                elif label == 0xFF and info is not None and bytes(view[pos + 3:pos + 14]) == b'NETSCAPE2.0':
+                    info.loop = struct.unpack_from('<H', view, pos + 16)[0]
+                pos = _skip_sub_blocks(view, pos + 2)
+            elif block == 0x2C: # Image descriptor
+                x, y, width, height, packed = struct.unpack_from('<HHHHB', view, pos + 1)
+                if start is None:
+                    start = pos
+                pos += 10
+                if packed & 0x80: # Local color table
+                    pos += 3 << ((packed & 7) + 1)
+                pos = _skip_sub_blocks(view, pos + 1) # After the LZW minimum code size
+                yield Frame(index, x, y, width, height, delay, disposal, view[start:pos], build)
+                index += 1
+                start = None
+                delay = None
+                disposal = 0
+            else:
+                raise _truncated('gif')
+    except (IndexError, struct.error):
+        raise _truncated('gif') from None
+
+def _gif_info(view:memoryview) -> ImageInfo:
+    width, height, _ = _gif_screen(view)
+    info = ImageInfo('gif', width, height)
+    durations = [frame.duration or 0 for frame in _gif_frames(view, info)]
+    info.frame_count = len(durations)
+    if info.frame_count > 1:
+        info.durations = tuple(durations)
+    else:
+        info.loop = None
+    return info
+
+# PNG
+
+def _png_chunks(view:memoryview, pos:int=8, complete:bool=True) -> Iterator[tuple]:
+    """
+    Yields `(type, start, data start, end)` of every chunk from `pos` on. If `complete` the chunks have to end with `IEND`
+    """
+    try:
+        while pos < len(view):
+            length = struct.unpack_from('>I', view, pos)[0]
+            kind = bytes(view[pos + 4:pos + 8])
+            end = pos + 12 + length
+            if end > len(view):
+                raise _truncated('png')
+            yield kind, pos, pos + 8, end
+            if kind == b'IEND':
+                return
+            pos = end
+    except struct.error:
+        raise _truncated('png') from None
+    if complete:
+        raise _truncated('png')
+
+def _chunk(kind:bytes, data) -> bytes:
+    return b''.join((struct.pack('>I', len(data)), kind, data, struct.pack('>I', zlib.crc32(data, zlib.crc32(kind)))))
+
+def _png_frames(view:memoryview, info:ImageInfo=None) -> Iterator[Frame]:
+    ihdr = None
+    ancillary = [] # Chunks every frame needs, e.g. the palette
+    animated = False
+    seen_data = False
+    current = None # [fcTL fields, start] of the frame being read
+    data_end = None
+    index = 0
+
+    def build(frame:Frame) -> bytes:
+        parts = [PNG_SIGNATURE, _chunk(b'IHDR', struct.pack('>II', frame.width, frame.height) + bytes(ihdr[8:]))]
+        parts.extend(ancillary)
+        for kind, _, data, end in _png_chunks(frame.data, 0, False):
+            if kind == b'IDAT':
+                parts.append(frame.data[data - 8:end])
+            elif kind == b'fdAT':
+                parts.append(_chunk(b'IDAT', frame.data[data + 4:end - 4]))
+        parts.append(_chunk(b'IEND', b''))
+        return b''.join(parts)
+
+    def still() -> Frame:
+        width, height = struct.unpack_from('>II', ihdr)
+        return Frame(0, 0, 0, width, height, None, 0, view, lambda frame: bytes(view))
+
+    for kind, start, data, end in _png_chunks(view):
+        if kind == b'IHDR':
+            ihdr = view[data:end - 4]
+        elif kind == b'acTL':
+            animated = True
+            if info is not None:
+                info.frame_count, info.loop = struct.unpack_from('>II', view, data)
+        elif kind == b'fcTL' and animated:
+            if current is not None:
+                yield _png_frame(index, current, view[current[1]:data_end], build)
+                index += 1
+            current = (struct.unpack_from('>IIIIIHHBB', view, data), start)
+            data_end = end
+        elif kind in (b'IDAT', b'fdAT'):
+            seen_data = True
+            if current is not None:
+                data_end = end
+        elif kind == b'IEND':
+            break
+        elif not seen_data and current is None:
+            ancillary.append(view[start:end])
+    if ihdr is None or not seen_data or (animated and current is None):
+        raise _truncated('png')
+    if not animated:
+        yield still()
+    else:
+        yield _png_frame(index, current, view[current[1]:data_end], build)
+
+def _png_frame(index:int, current:tuple, data:memoryview, build) -> Frame:
+    (_, width, height, x, y, numerator, denominator, disposal, _), _ = current
+    duration = round(numerator * 1000 / (denominator or 100))
+    return Frame(index, x, y, width, height, duration, disposal, data, build)
+
+def _png_info(view:memoryview) -> ImageInfo:
+    for kind, _, data, _ in _png_chunks(view):
+        if kind == b'IHDR':
+            break
+    else:
+        raise _truncated('png')
+    width, height = struct.unpack_from('>II', view, data)
+    info = ImageInfo('png', width, height)
+    durations = [frame.duration or 0 for frame in _png_frames(view, info)]
+    info.frame_count = len(durations)
+    if info.frame_count > 1:
+        info.durations = tuple(durations)
+    else:
+        info.loop = None
+    return info
+
+# JPEG
+
+def _jpeg_info(view:memoryview) -> ImageInfo:
+    pos = 2
+    try:
+        while True:
+            while view[pos] == 0xFF and view[pos + 1] == 0xFF: # Fill bytes
+                pos += 1
+            if view[pos] != 0xFF:
+                raise _truncated('jpeg')
+            marker = view[pos + 1]
+            if marker == 0x01 or 0xD0 <= marker <= 0xD8: # No length
+                pos += 2
+                continue
+            if marker in (0xD9, 0xDA): # End of image or start of scan before any frame header
+                raise _truncated('jpeg')
+            length = struct.unpack_from('>H', view, pos + 2)[0]
+            if marker in JPEG_SOF:
+                height, width = struct.unpack_from('>HH', view, pos + 5)
+                return ImageInfo('jpeg', width, height)
+            pos += 2 + length
+    except (IndexError, struct.error):
+        raise _truncated('jpeg') from None
+
+def _jpeg_frames(view:memoryview, info:ImageInfo=None) -> Iterator[Frame]:
+    info = _jpeg_info(view)
+    yield Frame(0, 0, 0, info.width, info.height, None, 0, view, lambda frame: bytes(view))
+
+PARSERS = {
+    'gif': (_gif_info, _gif_frames),
+    'png': (_png_info, _png_frames),
+    'jpeg': (_jpeg_info, _jpeg_frames)
+}
+
+def image_info(buffer) -> ImageInfo:
+    """
+    Reads the dimensions, frame count, frame durations and loop count of a GIF, PNG, APNG or JPEG without decoding it
+
+    # Parameters:
+        `buffer (bytes, bytearray or memoryview)`: The image
+
+    # Returns:
+        `ImageInfo`
+    """
+    view = _view(buffer)
+    return PARSERS[_format(view)][0](view)
+
+def iter_frames(buffer) -> Iterator[Frame]:
+    """
+    Lazily yields the frames of a GIF, APNG, PNG or JPEG as views of the buffer. Still images have a single frame
+
+    # Parameters:
+        `buffer (bytes, bytearray or memoryview)`: The image
+
+    # Returns:
+        An iterator of `Frame`
+    """
+    view = _view(buffer)
+    return PARSERS[_format(view)][1](view)
@@ -0,0 +1,75 @@
+"""
+The endpoint methods of `PxlClient` and `SyncPxlClient`, generated from `ENDPOINTS` when the module is imported.
+`methods.pyi` declares them for IDEs and type checkers, regenerate it with `python -m pypxl.methods` after changing `ENDPOINTS`
+"""
+import os
+from typing import List
+
+from .endpoints import ENDPOINTS, REQUIRED, Endpoint, Param, create_method
+from .preprocess import ImageInput
+
+class EndpointMethods:
+    """
+    The methods of `PxlClient` calling pxlapi, one per endpoint in `ENDPOINTS`
+    """
+
+class SyncEndpointMethods:
+    """
+    The blocking versions of the methods of `EndpointMethods`, `SyncPxlClient` adds them
+    """
+
+for _endpoint in ENDPOINTS:
+    setattr(EndpointMethods, _endpoint.name, create_method(_endpoint))
+del _endpoint
+
+def _annotation(param:Param) -> str:
+    if param.annotation == List[ImageInput]:
+        annotation = 'List[ImageInput]'
+    elif isinstance(param.annotation, type):
+        annotation = 'Any' if param.annotation is object else param.annotation.__name__
+    else:
+        annotation = repr(param.annotation).replace('typing.', '')
+    if param.default is None and annotation != 'Any':
+        return f'Optional[{annotation}]'
+    return annotation
+
+def _stub(endpoint:Endpoint, sync:bool) -> str:
+    params = ['self']
+    for param in endpoint.params:
+        if param.default is REQUIRED:
+            params.append(f'{param.name}: {_annotation(param)}')
+        else:
+            default = repr(param.default) if isinstance(param.default, (str, int, bool, type(None))) else '...'
+            params.append(f'{param.name}: {_annotation(param)} = {default}')
+    if endpoint.image:
+        params.append('sink: Any = None')
+    params.extend(('*', 'priority: int = 0', 'tenant: Optional[Hashable] = None', 'deadline: Optional[float] = None'))
+    docstring = '\n'.join(f'        {line}' if line else '' for line in endpoint.docstring().split('\n'))
+    return f'''    {'def' if sync else 'async def'} {endpoint.name}({', '.join(params)}) -> PxlObject:
+        """
+{docstring}
+        """
+        ...
+'''
+
+def stub_source() -> str:
+    """
+    Creates the source of `methods.pyi` from `ENDPOINTS`
+
+    # Returns:
+        `string`
+    """
+    parts = [
+        '# Generated from ENDPOINTS by `python -m pypxl.methods`, do not edit\n'
+        'from typing import Any, Hashable, List, Optional\n\n'
+        'from .preprocess import ImageInput\n'
+        'from .pxl_object import PxlObject\n'
+    ]
+    for cls, sync in ((EndpointMethods, False), (SyncEndpointMethods, True)):
+        parts.append(f'class {cls.__name__}:\n')
+        parts.extend(_stub(endpoint, sync) for endpoint in ENDPOINTS)
+    return '\n'.join(parts)
+
+if __name__ == '__main__':
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'methods.pyi'), 'w') as f:
+        f.write(stub_source())
@@ -0,0 +1,617 @@
+# Generated from ENDPOINTS by `python -m pypxl.methods`, do not edit
+from typing import Any, Hashable, List, Optional
+
+from .preprocess import ImageInput
+from .pxl_object import PxlObject
+
+class EndpointMethods:
+
+    async def emojaic(self, images: List[ImageInput], groupSize: int = 12, scale: bool = False, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into images assebled by emojis
+
+        # Parameters:
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `groupSize (int)`: The group size
+            `scale (boolean)`: To have the returned image at the same scale or not
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def flag(self, flag: str, images: List[ImageInput], opacity: int = 128, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into images with the flag specified
+
+        # Parameters:
+            `flag (string)`: The name of the flag to use
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `opacity (int)`: What opacity to overlay the flag with
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def ajit(self, images: List[ImageInput], sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Overlays an image of Ajit Pai snacking on some popcorn
+
+        # Parameters:
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def flash(self, images: List[ImageInput], sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into flash images
+
+        # Parameters:
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def glitch(self, images: List[ImageInput], delay: int = 100, count: int = 10, amount: int = 5, iterations: int = 10, gif: Optional[bool] = None, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into images into glitch GIFs and/or images
+
+        # Parameters:
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `delay (int)`: How long to display each frame for (in ms)
+            `count (int)`: How many frames to generate
+            `amount (int)`: Byte chunk length
+            `iterations (int)`: How many byte chunks to modify
+            `gif (boolean)`: Additional information for glitching static images into a GIF
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def lego(self, images: List[ImageInput], scale: bool = False, groupSize: int = 8, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into images into images made up of lego bricks
+
+        # Parameters:
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `scale (boolean)`: Whether to resize the resulting image to the original images dimensions
+            `groupSize (int)`: How big of a pixel square to group into one brick. Defaults to a 32x32 brick result
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def jpeg(self, images: List[ImageInput], quality: int = 1, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into lower quality
+
+        # Parameters:
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `quality (int)`: What JPEG quality to encode the image as
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def snapchat(self, filter: str, images: List[ImageInput], filters: Optional[list] = None, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into images with the snap filter provided if a face is detected
+
+        # Parameters:
+            `filter (string)`: The filter to apply
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `filters (list)`: What filters to limit "random" to (defaults to all available filters)
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def eyes(self, eyes: str, images: List[ImageInput], filters: Optional[list] = None, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into images with a filter applied to the eyes of faces detected
+
+        # Parameters:
+            `eyes (string)`: The filter to apply
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `filters (list)`: What filters to limit "random" to (defaults to all available filters)
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def thonkify(self, text: str, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided text into an image with that text made up of thonks
+
+        # Parameters:
+            `text (string)`: The text to thonkify
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def sonic(self, text: str, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided text into an image with sonic saying the provided text
+
+        # Parameters:
+            `text (string)`: The text to let sonic say
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def klines(self, pair: Optional[str] = None, interval: str = '1m', limit: int = 90, ticks: Optional[List[int]] = None, custom: Optional[dict] = None, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Creates a candlestick chart for the given coin pair / ticks
+
+        # Parameters:
+            `pair (string)`: The [coin pair](https://www.binance.com/api/v3/exchangeInfo) to generate a candlestick chart for (e.g. `BNBBUSD`). Optional if custom ticks are sent.
+            `interval (string)`: Timespan between candlesticks
+            `limit (int)`: How many candlesticks to draw
+            `ticks (list)`: Custom ticks (lets you send in [binance API compatible](https://github.com/binance/binance-spot-api-docs/blob/master/rest-api.md#klinecandlestick-data) tick data)
+            `custom (dict)`: Custom pair data to display
+                key `baseAsset (string)`: Custom base asset name to display
+                value `quoteAsset (string)`: Custom quote asset name to display
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def imagescript(self, version: str, code: str, inject: Any = None, timeout: int = 10000, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Evaluates code
+
+        # Parameters:
+            `version (string)`: The version of imagescript to use
+            `code (string)`: The code to evaluate
+            `inject (object)`: The data to inject as global variables
+            `timeout (int)`: Maximum run time in ms
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def imagescript_version(self, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Gives you the available versions for imagescript
+
+        # Parameters:
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def image_search(self, query: str, safeSearch: str = 'strict', meta: bool = False, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Looks for images with provided query
+
+        # Parameters:
+            `query (string)`: What to search for
+            `safeSearch (string)`: What safe search setting to use
+            `meta (boolean)`: Whether to return meta data (page title and URL)
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def screenshot(self, url: str, device: Optional[str] = None, locale: str = 'en_US', blocklist: Optional[list] = None, defaultBlocklist: bool = True, browser: str = 'chromium', theme: str = 'dark', timeout: int = 30000, fullPage: bool = False, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Screenshots the webpage provided
+
+        # Parameters:
+            `url (string)`: The website to screenshot
+            `device (string)`: The device to emulate. See [list of available devices](https://github.com/microsoft/playwright/blob/17e953c2d8bd19ace20059ffaaa85f3f23cfb19d/src/server/deviceDescriptors.js#L21-L857). Defaults to a non-specific browser with a viewport of 1920x1080 pixels.
+            `locale (string)`: The locale to set the browser to
+            `blocklist (list)`: A list of domains to block
+            `defaultBlocklist (boolean)`: Whether to block a list of predefined, known-bad domains (e.g. NSFW content)
+            `browser (string)`: What browser engine to use for screenshotting
+            `theme (string)`: What theme to use
+            `timeout (int)`: The max time to wait until the site has loaded (in ms)
+            `fullPage (boolean)`: Whether to capture the entire page
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    async def web_search(self, query: str, safeSearch: str = 'strict', *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Searches for the query provided
+
+        # Parameters:
+            `query (string)`: What to search for
+            `safeSearch (string)`: What safe search setting to use
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+class SyncEndpointMethods:
+
+    def emojaic(self, images: List[ImageInput], groupSize: int = 12, scale: bool = False, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into images assebled by emojis
+
+        # Parameters:
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `groupSize (int)`: The group size
+            `scale (boolean)`: To have the returned image at the same scale or not
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def flag(self, flag: str, images: List[ImageInput], opacity: int = 128, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into images with the flag specified
+
+        # Parameters:
+            `flag (string)`: The name of the flag to use
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `opacity (int)`: What opacity to overlay the flag with
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def ajit(self, images: List[ImageInput], sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Overlays an image of Ajit Pai snacking on some popcorn
+
+        # Parameters:
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def flash(self, images: List[ImageInput], sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into flash images
+
+        # Parameters:
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def glitch(self, images: List[ImageInput], delay: int = 100, count: int = 10, amount: int = 5, iterations: int = 10, gif: Optional[bool] = None, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into images into glitch GIFs and/or images
+
+        # Parameters:
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `delay (int)`: How long to display each frame for (in ms)
+            `count (int)`: How many frames to generate
+            `amount (int)`: Byte chunk length
+            `iterations (int)`: How many byte chunks to modify
+            `gif (boolean)`: Additional information for glitching static images into a GIF
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def lego(self, images: List[ImageInput], scale: bool = False, groupSize: int = 8, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into images into images made up of lego bricks
+
+        # Parameters:
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `scale (boolean)`: Whether to resize the resulting image to the original images dimensions
+            `groupSize (int)`: How big of a pixel square to group into one brick. Defaults to a 32x32 brick result
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def jpeg(self, images: List[ImageInput], quality: int = 1, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into lower quality
+
+        # Parameters:
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `quality (int)`: What JPEG quality to encode the image as
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def snapchat(self, filter: str, images: List[ImageInput], filters: Optional[list] = None, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into images with the snap filter provided if a face is detected
+
+        # Parameters:
+            `filter (string)`: The filter to apply
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `filters (list)`: What filters to limit "random" to (defaults to all available filters)
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def eyes(self, eyes: str, images: List[ImageInput], filters: Optional[list] = None, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided images into images with a filter applied to the eyes of faces detected
+
+        # Parameters:
+            `eyes (string)`: The filter to apply
+            `images (list)`: The images to proccess, as URLs, bytes, `pathlib.Path`s or `PxlObject`s of earlier requests
+            `filters (list)`: What filters to limit "random" to (defaults to all available filters)
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def thonkify(self, text: str, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided text into an image with that text made up of thonks
+
+        # Parameters:
+            `text (string)`: The text to thonkify
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def sonic(self, text: str, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Turns the provided text into an image with sonic saying the provided text
+
+        # Parameters:
+            `text (string)`: The text to let sonic say
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def klines(self, pair: Optional[str] = None, interval: str = '1m', limit: int = 90, ticks: Optional[List[int]] = None, custom: Optional[dict] = None, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Creates a candlestick chart for the given coin pair / ticks
+
+        # Parameters:
+            `pair (string)`: The [coin pair](https://www.binance.com/api/v3/exchangeInfo) to generate a candlestick chart for (e.g. `BNBBUSD`). Optional if custom ticks are sent.
+            `interval (string)`: Timespan between candlesticks
+            `limit (int)`: How many candlesticks to draw
+            `ticks (list)`: Custom ticks (lets you send in [binance API compatible](https://github.com/binance/binance-spot-api-docs/blob/master/rest-api.md#klinecandlestick-data) tick data)
+            `custom (dict)`: Custom pair data to display
+                key `baseAsset (string)`: Custom base asset name to display
+                value `quoteAsset (string)`: Custom quote asset name to display
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def imagescript(self, version: str, code: str, inject: Any = None, timeout: int = 10000, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Evaluates code
+
+        # Parameters:
+            `version (string)`: The version of imagescript to use
+            `code (string)`: The code to evaluate
+            `inject (object)`: The data to inject as global variables
+            `timeout (int)`: Maximum run time in ms
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def imagescript_version(self, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Gives you the available versions for imagescript
+
+        # Parameters:
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def image_search(self, query: str, safeSearch: str = 'strict', meta: bool = False, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Looks for images with provided query
+
+        # Parameters:
+            `query (string)`: What to search for
+            `safeSearch (string)`: What safe search setting to use
+            `meta (boolean)`: Whether to return meta data (page title and URL)
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def screenshot(self, url: str, device: Optional[str] = None, locale: str = 'en_US', blocklist: Optional[list] = None, defaultBlocklist: bool = True, browser: str = 'chromium', theme: str = 'dark', timeout: int = 30000, fullPage: bool = False, sink: Any = None, *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Screenshots the webpage provided
+
+        # Parameters:
+            `url (string)`: The website to screenshot
+            `device (string)`: The device to emulate. See [list of available devices](https://github.com/microsoft/playwright/blob/17e953c2d8bd19ace20059ffaaa85f3f23cfb19d/src/server/deviceDescriptors.js#L21-L857). Defaults to a non-specific browser with a viewport of 1920x1080 pixels.
+            `locale (string)`: The locale to set the browser to
+            `blocklist (list)`: A list of domains to block
+            `defaultBlocklist (boolean)`: Whether to block a list of predefined, known-bad domains (e.g. NSFW content)
+            `browser (string)`: What browser engine to use for screenshotting
+            `theme (string)`: What theme to use
+            `timeout (int)`: The max time to wait until the site has loaded (in ms)
+            `fullPage (boolean)`: Whether to capture the entire page
+            `sink (file, path, file descriptor or writer)`: Where to write the image to while it is received instead of keeping it in memory
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
+
+    def web_search(self, query: str, safeSearch: str = 'strict', *, priority: int = 0, tenant: Optional[Hashable] = None, deadline: Optional[float] = None) -> PxlObject:
+        """
+        Searches for the query provided
+
+        # Parameters:
+            `query (string)`: What to search for
+            `safeSearch (string)`: What safe search setting to use
+            `priority (int)`: Requests with a higher priority are sent first if the client has a `Scheduler`
+            `tenant (hashable)`: Who the request is made for, e.g. a guild id. The `Scheduler` shares capacity fairly between tenants
+            `deadline (float)`: How many seconds to wait for the response at most before the request is cancelled, defaults to the `deadline` of the client
+
+        # Returns:
+            `PxlObject`
+        """
+        ...
@@ -0,0 +1,187 @@
+import inspect
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+from .pxl_object import PxlObject
+
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+class Histogram:
+    """
+    A cumulative histogram in the style of Prometheus
+
+    # Parameters:
+        `buckets (tuple)`: The upper bounds of the buckets, sorted
+    """
+    def __init__(self, buckets:tuple=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1) # The last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value:float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list:
+        total = 0
+        res = []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            res.append((bound, total))
+        return res
+
+    def quantile(self, q:float) -> float:
+        """
+        Estimates a quantile as the upper bound of the bucket it falls into
+
+        # Parameters:
+            `q (float)`: The quantile, between 0 and 1
+
+        # Returns:
+            `float` or None if nothing was observed yet
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+
+def _labels(**labels) -> str:
+    return '{' + ','.join(f'{k}="{v}"' for k, v in labels.items()) + '}'
+
+def _format(value) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Metrics:
+    """
+    Collects per endpoint latency, payload sizes, requests in flight and errors of a `PxlClient`.
+    Endpoints are grouped by their first path segment, so `flag/trans` and `flag/gay` are both counted as `flag`
+
+    # Optional parameters:
+        `buckets (tuple)`: The upper bounds of the latency histogram buckets in seconds
+
+    # Properties:
+        latency (dictionary): A `Histogram` of the request duration in seconds per endpoint
+        request_bytes (dictionary): How many body bytes were sent per endpoint
+        response_bytes (dictionary): How many bytes were received per endpoint
+        in_flight (dictionary): How many requests are currently in flight per endpoint
+        errors (dictionary): How many responses failed per (endpoint, status), connection errors have the status `connection`
+        pre_request (list): Functions called with `(endpoint, body)` before a request is sent, `body` is the encoded json
+        post_response (list): Functions called with `(endpoint, result, seconds)` after a request finished, `result` is a `PxlObject` or the error raised
+
+    # Methods:
+        `add_source(name, obj)`
+            Includes the `stats()` of another object, e.g. a cache, in the export
+        `render_prometheus()`
+            Renders everything in the Prometheus text format
+    """
+    def __init__(self, buckets:tuple=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.latency = {}
+        self.request_bytes = defaultdict(int)
+        self.response_bytes = defaultdict(int)
+        self.in_flight = defaultdict(int)
+        self.errors = defaultdict(int)
+        self.pre_request = []
+        self.post_response = []
+        self.sources = {}
+
+    def add_source(self, name:str, obj) -> None:
+        self.sources[name] = obj
+
+    @staticmethod
+    async def _call(hooks:list, *args) -> None:
+        for hook in hooks:
+            res = hook(*args)
+            if inspect.isawaitable(res):
+                await res
+
+    def error(self, endpoint:str, status) -> None:
+        self.errors[(endpoint.split('/')[0], str(status))] += 1
+
+    async def observe(self, endpoint:str, body:bytes, coro) -> PxlObject:
+        """
+        Awaits a request while measuring it
+
+        # Parameters:
+            `endpoint (string)`: The endpoint the request is made to
+            `body (bytes)`: The encoded body of the request
+            `coro (coroutine)`: The request
+
+        # Returns:
+            `PxlObject`
+        """
+        name = endpoint.split('/')[0]
+        if self.pre_request:
+            await self._call(self.pre_request, endpoint, body)
+        self.request_bytes[name] += len(body)
+        self.in_flight[name] += 1
+        start = time.perf_counter()
+        try:
+            res = await coro
+        except BaseException as e:
+            elapsed = time.perf_counter() - start
+            self._finish(name, elapsed)
+            if self.post_response:
+                await self._call(self.post_response, endpoint, e, elapsed)
+            raise
+        elapsed = time.perf_counter() - start
+        self._finish(name, elapsed)
+        if res.size:
+            self.response_bytes[name] += res.size
+        if self.post_response:
+            await self._call(self.post_response, endpoint, res, elapsed)
+        return res
+
+    def _finish(self, name:str, elapsed:float) -> None:
+        self.in_flight[name] -= 1
+        histogram = self.latency.get(name)
+        if histogram is None:
+            histogram = self.latency[name] = Histogram(self.buckets)
+        histogram.observe(elapsed)
+
+    def render_prometheus(self) -> str:
+        """
+        Renders all metrics in the Prometheus text exposition format
+
+        # Returns:
+            `string`
+        """
+        lines = [
+            '# HELP pypxl_request_duration_seconds How long requests to pxlapi took',
+            '# TYPE pypxl_request_duration_seconds histogram'
+        ]
+        for name, histogram in sorted(self.latency.items()):
+            for bound, total in histogram.cumulative():
+                lines.append(f'pypxl_request_duration_seconds_bucket{_labels(endpoint=name, le=_format(bound))} {total}')
+            lines.append(f'pypxl_request_duration_seconds_sum{_labels(endpoint=name)} {_format(histogram.sum)}')
+            lines.append(f'pypxl_request_duration_seconds_count{_labels(endpoint=name)} {histogram.count}')
+
+        for metric, kind, help, values in (
+            ('pypxl_request_bytes_total', 'counter', 'How many body bytes were sent to pxlapi', self.request_bytes),
+            ('pypxl_response_bytes_total', 'counter', 'How many bytes were received from pxlapi', self.response_bytes),
+            ('pypxl_requests_in_flight', 'gauge', 'How many requests to pxlapi are in flight', self.in_flight)
+        ):
+            lines.append(f'# HELP {metric} {help}')
+            lines.append(f'# TYPE {metric} {kind}')
+            for name, value in sorted(values.items()):
+                lines.append(f'{metric}{_labels(endpoint=name)} {value}')
+
+        lines.append('# HELP pypxl_errors_total How many requests to pxlapi failed')
+        lines.append('# TYPE pypxl_errors_total counter')
+        for (name, status), value in sorted(self.errors.items()):
+            lines.append(f'pypxl_errors_total{_labels(endpoint=name, status=status)} {value}')
+
+        for source, obj in sorted(self.sources.items()):
+            for key, value in obj.stats().items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    lines.append(f'# TYPE pypxl_{source}_{key} gauge')
+                    lines.append(f'pypxl_{source}_{key} {_format(value)}')
+
+        return '\n'.join(lines) + '\n'
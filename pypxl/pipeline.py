@@ -0,0 +1,200 @@
+import asyncio
+import hashlib
+import time
+
+from .cache import ImageCache, is_deterministic
+from .endpoints import ENDPOINTS, REQUIRED
+from .pxl_object import PxlObject
+
+IMAGE_ENDPOINTS = {endpoint.name: endpoint for endpoint in ENDPOINTS if endpoint.image}
+# Arguments which change how a request is made but not its result
+CALL_OPTIONS = frozenset(('priority', 'tenant', 'deadline'))
+
+class Stage:
+    """
+    One call in a `Pipeline`, created with `Pipeline.stage`
+
+    # Properties:
+        name (string): The name of the stage, unique in its pipeline
+        method (string): The method called, e.g. `"flag"`
+        inputs (tuple): The stages or images whose output is sent as `images`
+        kwargs (dictionary): The other arguments of the method
+    """
+    __slots__ = ('name', 'method', 'inputs', 'kwargs')
+
+    def __init__(self, name:str, method:str, inputs:tuple, kwargs:dict):
+        self.name = name
+        self.method = method
+        self.inputs = inputs
+        self.kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return f'<Stage {self.name}>'
+
+class PipelineResult:
+    """
+    The outcome of running a `Pipeline`. Index it with a stage or its name to get the `PxlObject` of the stage
+
+    # Properties:
+        results (dictionary): The `PxlObject` of every stage by name
+        timings (dictionary): How many seconds every stage took by name, not counting the time waiting for its inputs
+        cached (set): The names of the stages served from the cache
+        elapsed (float): How many seconds the whole pipeline took
+        success (boolean): Whether every stage succeeded
+    """
+    __slots__ = ('results', 'timings', 'cached', 'elapsed')
+
+    def __init__(self):
+        self.results = {}
+        self.timings = {}
+        self.cached = set()
+        self.elapsed = 0.0
+
+    def __getitem__(self, stage) -> PxlObject:
+        return self.results[stage.name if isinstance(stage, Stage) else stage]
+
+    @property
+    def success(self) -> bool:
+        return all(res.success for res in self.results.values())
+
+class Pipeline:
+    """
+    Chains image methods, sending the output of a stage inline as the `images` of the next ones, so no intermediate image has to be hosted anywhere.
+    Stages whose inputs are ready run concurrently. Results of deterministic stages are cached, so running a chain again only makes the requests
+    whose inputs changed. Create one with `PxlClient.pipeline`
+
+    # Parameters:
+        `client (PxlClient)`: The client making the requests
+
+    # Optional parameters:
+        `images (list)`: The images stages without inputs start from
+        `cache (ImageCache)`: Where to keep intermediate results between runs, defaults to the cache of the client
+
+    # Example:
+        ```py
+        pipe = pxl.pipeline(images=[url])
+        jpeg = pipe.stage("jpeg")
+        glitched = pipe.stage("glitch", jpeg)
+        lego = pipe.stage("lego", pipe.stage("flag", jpeg, flag="trans"))
+        res = await pipe.run()
+        print(res[glitched].success, res[lego].success, res.timings)
+        ```
+    """
+    def __init__(self, client, images:list=None, cache:ImageCache=None):
+        self.client = client
+        self.images = list(images) if images is not None else []
+        self.cache = cache if cache is not None else client.cache
+        self.stages = []
+        self._names = set()
+
+    def stage(self, method:str, *inputs, name:str=None, **kwargs) -> Stage:
+        """
+        Adds a stage
+
+        # Parameters:
+            `method (string)`: The image method to call, e.g. `"flag"`
+            `inputs (Stage or image)`: What to send as `images`, the outputs of other stages or images. Defaults to the images of the pipeline
+            `name (string)`: The name of the stage, defaults to the method with a number appended if it is used more than once
+            `kwargs`: The other arguments of the method, e.g. `flag="trans"`
+
+        # Returns:
+            `Stage`, to pass as input to later stages and to get its result
+        """
+        endpoint = IMAGE_ENDPOINTS.get(method)
+        if endpoint is None:
+            raise ValueError(f"{method} is not an image method")
+        takes_images = any(param.name == 'images' for param in endpoint.params)
+        if inputs and not takes_images:
+            raise ValueError(f"{method} does not take images")
+        if 'images' in kwargs:
+            raise ValueError("Pass the images of a stage as inputs")
+        for stage in inputs:
+            if isinstance(stage, Stage) and stage not in self.stages:
+                raise ValueError(f"{stage.name} is not a stage of this pipeline")
+
+        if name is None:
+            name = method
+            number = 1
+            while name in self._names:
+                number += 1
+                name = f'{method}#{number}'
+        elif name in self._names:
+            raise ValueError(f"There already is a stage named {name}")
+        self._names.add(name)
+        stage = Stage(name, method, (inputs or tuple(self.images)) if takes_images else (), kwargs)
+        self.stages.append(stage)
+        return stage
+
+    def _key(self, stage:Stage, keys:dict) -> str:
+        """
+        The cache key of a stage, None if its result can differ between runs
+        """
+        endpoint = IMAGE_ENDPOINTS[stage.method]
+        args = {param.name: stage.kwargs.get(param.name, param.default) for param in endpoint.params if param.name != 'images'}
+        if REQUIRED in args.values() or endpoint.validate(args) is not None:
+            return None # The request fails, there is nothing to cache
+        if not is_deterministic(endpoint.static_path or endpoint.path(args), None): # e.g. snapchat/random
+            return None
+        digest = hashlib.sha256(stage.method.encode())
+        digest.update(self.client.codec.dumps(sorted((k, v) for k, v in stage.kwargs.items() if k not in CALL_OPTIONS)))
+        for image in stage.inputs:
+            if isinstance(image, Stage):
+                key = keys[image.name]
+                if key is None:
+                    return None
+                digest.update(key.encode())
+            elif isinstance(image, str):
+                digest.update(image.encode())
+            elif isinstance(image, PxlObject):
+                digest.update(hashlib.sha256(image.buffer).digest())
+            else:
+                return None # Paths can change between runs
+            digest.update(b'\n')
+        return 'pipeline:' + digest.hexdigest()
+
+    async def _run_stage(self, stage:Stage, tasks:dict, keys:dict, result:PipelineResult) -> PxlObject:
+        images = []
+        for image in stage.inputs:
+            if not isinstance(image, Stage):
+                images.append(image)
+                continue
+            res = await tasks[image.name]
+            if not res.success:
+                return PxlObject(success=False, error=f'Stage {image.name} failed: {res.error}')
+            images.append(res)
+
+        start = time.perf_counter()
+        key = keys[stage.name] = self._key(stage, keys)
+        res = self.cache.get(key) if key is not None and self.cache is not None else None
+        if res is not None:
+            result.cached.add(stage.name)
+        else:
+            kwargs = dict(stage.kwargs, images=images) if stage.inputs else stage.kwargs
+            res = await getattr(self.client, stage.method)(**kwargs)
+            if key is not None and self.cache is not None:
+                self.cache.put(key, res)
+        result.timings[stage.name] = time.perf_counter() - start
+        return res
+
+    async def run(self) -> PipelineResult:
+        """
+        Runs all stages, each as soon as its inputs are ready. A stage whose input failed fails as well without making a request.
+        If `stop_on_error` is enabled the first error is raised and the other stages are cancelled
+
+        # Returns:
+            `PipelineResult`
+        """
+        result = PipelineResult()
+        tasks = {}
+        keys = {}
+        start = time.perf_counter()
+        for stage in self.stages: # Inputs are always added before the stages using them
+            tasks[stage.name] = asyncio.ensure_future(self._run_stage(stage, tasks, keys, result))
+        try:
+            for name, res in zip(tasks, await asyncio.gather(*tasks.values())):
+                result.results[name] = res
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        result.elapsed = time.perf_counter() - start
+        return result
@@ -0,0 +1,126 @@
+import asyncio
+
+from .cache import ImageCache, make_key
+from .pxl_object import PxlObject
+from .stream import CHUNK_SIZE
+
+class Prefetcher:
+    """
+    Downloads the images of the top results of `image_search` with `meta=True` in the background while the first one is shown,
+    so paging through the results serves them from memory. Get them with `PxlClient.download(url)`
+
+    # Optional parameters:
+        `cache (ImageCache)`: Where to keep the downloaded images
+        `top (int)`: How many results of each search to download
+        `concurrency (int)`: How many downloads may run at once
+        `max_bytes (int)`: Larger images are not downloaded completely
+        `timeout (float)`: How many seconds a download may take
+
+    # Properties:
+        scheduled (int): How many downloads were started in the background
+        downloaded (int): How many downloads succeeded
+        failed (int): How many downloads failed
+    """
+    def __init__(self, cache:ImageCache=None, top:int=5, concurrency:int=4, max_bytes:int=8*1024*1024, timeout:float=10.0):
+        self.cache = cache if cache is not None else ImageCache(max_entries=64)
+        self.top = top
+        self.concurrency = concurrency
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.scheduled = 0
+        self.downloaded = 0
+        self.failed = 0
+        self._semaphore = None
+        self._in_flight = {}
+
+    @staticmethod
+    def key(url:str) -> str:
+        return make_key('download', url.encode())
+
+    def schedule(self, transport, results) -> int:
+        """
+        Starts downloading the images of the top search results which are not cached or downloading yet
+
+        # Parameters:
+            `transport (Transport)`: How to download the images
+            `results (list)`: The `data` of an `image_search` with `meta=True`
+
+        # Returns:
+            `int`, how many downloads were started
+        """
+        started = 0
+        for result in results[:self.top]:
+            url = result.get('url') if isinstance(result, dict) else None
+            if not url or url in self._in_flight or self.key(url) in self.cache:
+                continue
+            self._start(transport, url)
+            started += 1
+        self.scheduled += started
+        return started
+
+    def _start(self, transport, url:str) -> asyncio.Task:
+        task = self._in_flight[url] = asyncio.ensure_future(self._download(transport, url))
+        task.add_done_callback(lambda t: self._in_flight.pop(url, None))
+        return task
+
+    async def _download(self, transport, url:str) -> PxlObject:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            try:
+                r = await transport.get(url, self.timeout)
+                if r.status != 200:
+                    r.release()
+                    res = PxlObject(success=False, error=f'Downloading {url} failed with status {r.status}')
+                else:
+                    chunks = []
+                    size = 0
+                    async for chunk in r.content.iter_chunked(CHUNK_SIZE):
+                        size += len(chunk)
+                        if size > self.max_bytes:
+                            r.release()
+                            raise ValueError(f'{url} is larger than {self.max_bytes} bytes')
+                        chunks.append(chunk)
+                    res = PxlObject(success=True, image_bytes=b''.join(chunks), content_type=r.content_type)
+            except Exception as e:
+                res = PxlObject(success=False, error=f'Downloading {url} failed: {e}')
+        if res.success:
+            self.downloaded += 1
+            self.cache.put(self.key(url), res)
+        else:
+            self.failed += 1
+        return res
+
+    async def fetch(self, transport, url:str) -> PxlObject:
+        """
+        Returns a downloaded image, waiting for its download if it is in progress and downloading it if it was not prefetched
+
+        # Parameters:
+            `transport (Transport)`: How to download the image
+            `url (string)`: The url of the image
+
+        # Returns:
+            `PxlObject`
+        """
+        cached = self.cache.get(self.key(url))
+        if cached is not None:
+            return cached
+        task = self._in_flight.get(url)
+        if task is None:
+            task = self._start(transport, url)
+        return await asyncio.shield(task)
+
+    def cancel(self) -> None:
+        """
+        Cancels the downloads in flight
+        """
+        for task in list(self._in_flight.values()):
+            task.cancel()
+
+    def stats(self) -> dict:
+        return {
+            'scheduled': self.scheduled,
+            'downloaded': self.downloaded,
+            'failed': self.failed,
+            'in_flight': len(self._in_flight)
+        }
@@ -0,0 +1,159 @@
+import asyncio
+import base64
+import io
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Union
+
+from .pxl_object import PxlObject
+
+try:
+    from PIL import Image, ImageSequence
+except ImportError:
+    Image = None
+
+ImageInput = Union[str, bytes, bytearray, memoryview, os.PathLike, PxlObject]
+
+MIME_TYPES = (
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'BM', 'image/bmp')
+)
+
+def sniff_mime(data) -> str:
+    """
+    Guesses the content type of image bytes from their signature
+
+    # Parameters:
+        `data (bytes)`: The image bytes
+
+    # Returns:
+        `string`
+    """
+    head = bytes(data[:12])
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+    for signature, mime in MIME_TYPES:
+        if head.startswith(signature):
+            return mime
+    return 'application/octet-stream'
+
+def to_data_uri(data, mime:str=None) -> str:
+    return f'data:{mime or sniff_mime(data)};base64,{base64.b64encode(data).decode()}'
+
+def _resize(image, max_size:int):
+    if max(image.size) <= max_size:
+        return image
+    image = image.copy()
+    image.thumbnail((max_size, max_size), Image.LANCZOS)
+    return image
+
+def shrink(data, max_size:int, format:str=None, quality:int=85) -> tuple:
+    """
+    Downscales an image so its longest side is at most `max_size` and re-encodes it without metadata.
+    Animated GIFs stay animated. If the result is not smaller than the input the input is returned unchanged.
+    This is CPU bound and meant to run in an executor
+
+    # Parameters:
+        `data (bytes)`: The image bytes
+        `max_size (int)`: The maximum width and height
+        `format (string)`: The format to encode to, e.g. `"PNG"`, `"JPEG"` or `"WEBP"`. Defaults to PNG for images with transparency and JPEG otherwise
+        `quality (int)`: The quality for lossy formats
+
+    # Returns:
+        `(bytes, content type)`
+    """
+    image = Image.open(io.BytesIO(data))
+    out = io.BytesIO()
+    if getattr(image, 'is_animated', False):
+        frames = []
+        durations = []
+        for frame in ImageSequence.Iterator(image):
+            frames.append(_resize(frame.convert('RGBA'), max_size))
+            durations.append(frame.info.get('duration', 100))
+        frames[0].save(out, format='GIF', save_all=True, append_images=frames[1:], loop=image.info.get('loop', 0), duration=durations, disposal=2)
+        mime = 'image/gif'
+    else:
+        image = _resize(image, max_size)
+        if format is None:
+            format = 'PNG' if image.mode in ('RGBA', 'LA', 'P') else 'JPEG'
+        if format.upper() == 'JPEG' and image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        image.save(out, format=format, quality=quality, optimize=True) # Metadata is only kept if passed explicitly
+        mime = Image.MIME.get(format.upper(), sniff_mime(out.getbuffer()))
+
+    if out.tell() >= len(data):
+        return bytes(data), sniff_mime(data)
+    return out.getvalue(), mime
+
+def encode_image(image, max_size:int=None, format:str=None, quality:int=85) -> str:
+    """
+    Turns an image input into a data URI which can be sent to pxlapi, shrinking it first if `max_size` is set
+
+    # Parameters:
+        `image (bytes, path or PxlObject)`: The image
+        `max_size (int)`: The maximum width and height, None to send the image as it is
+
+    # Returns:
+        `string`
+    """
+    if isinstance(image, PxlObject):
+        data = image.image_bytes
+    elif isinstance(image, os.PathLike):
+        with open(image, 'rb') as f:
+            data = f.read()
+    else:
+        data = image
+
+    if max_size is None:
+        return to_data_uri(data)
+    return to_data_uri(*shrink(data, max_size, format, quality))
+
+class Preprocessor:
+    """
+    Shrinks images passed as bytes, paths or `PxlObject`s before they are sent to pxlapi inline. Requires Pillow
+
+    # Optional parameters:
+        `max_size (int)`: The maximum width and height of images sent to pxlapi
+        `format (string)`: The format to encode images to, defaults to PNG for images with transparency and JPEG otherwise
+        `quality (int)`: The quality for lossy formats
+        `executor (Executor)`: Where to run the CPU bound work, defaults to the thread pool of the event loop. A `ProcessPoolExecutor` can be used as well
+    """
+    def __init__(self, max_size:int=512, format:str=None, quality:int=85, executor:Executor=None):
+        if Image is None:
+            raise ImportError("Preprocessing images requires Pillow, install it with pip3 install pypxl[preprocess]")
+        self.max_size = max_size
+        self.format = format
+        self.quality = quality
+        self.executor = executor
+
+async def prepare_images(images:List[ImageInput], preprocessor:Preprocessor=None) -> List[str]:
+    """
+    Turns all images which are not URLs into data URIs, off the event loop
+
+    # Parameters:
+        `images (list)`: URLs, bytes, paths or `PxlObject`s
+        `preprocessor (Preprocessor)`: How to shrink the images, None to send them as they are
+
+    # Returns:
+        `list` of strings
+    """
+    if all(isinstance(image, str) for image in images):
+        return images
+
+    loop = asyncio.get_running_loop()
+    executor = preprocessor.executor if preprocessor is not None else None
+    options = (preprocessor.max_size, preprocessor.format, preprocessor.quality) if preprocessor is not None else ()
+    pending = []
+    for image in images:
+        if isinstance(image, str):
+            pending.append(image)
+            continue
+        if isinstance(executor, ProcessPoolExecutor): # Only picklable arguments can be sent to another process
+            image = image.image_bytes if isinstance(image, PxlObject) else image
+            image = bytes(image) if isinstance(image, memoryview) else image
+        pending.append(loop.run_in_executor(executor, encode_image, image, *options))
+
+    return [image if isinstance(image, str) else await image for image in pending]
@@ -1,38 +1,225 @@
 import io
+import os
 from .errors import InvalidBytes
+from .imageinfo import ImageInfo, Frame, image_info, iter_frames
+from typing import Iterator
+
+class BufferReader(io.BufferedIOBase):
+    """
+    A file-like object over a buffer which does not copy it, with the methods of `io.BytesIO` including `getvalue()` and `getbuffer()`.
+    The buffer is only copied if the object is written to, the original is never changed
+
+    # Parameters:
+        `buffer (bytes, bytearray or memoryview)`: The buffer to read from
+    """
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast('B')
+        self._pos = 0
+        self._copy = None # The io.BytesIO used once the object was written to
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+    def _writable_copy(self) -> io.BytesIO:
+        if self._copy is None:
+            self._copy = io.BytesIO(self._view)
+            self._copy.seek(self._pos)
+            self._view = None
+        return self._copy
+
+    def tell(self) -> int:
+        self._check_open()
+        if self._copy is not None:
+            return self._copy.tell()
+        return self._pos
+
+    def seek(self, offset:int, whence:int=io.SEEK_SET) -> int:
+        self._check_open()
+        if self._copy is not None:
+            return self._copy.seek(offset, whence)
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError("Negative seek position")
+        self._pos = offset
+        return self._pos
+
+    def read(self, size:int=-1) -> bytes:
+        self._check_open()
+        if self._copy is not None:
+            return self._copy.read(size)
+        end = len(self._view) if size is None or size < 0 else min(self._pos + size, len(self._view))
+        data = self._view[self._pos:end].tobytes()
+        self._pos = max(self._pos, end)
+        return data
+
+    read1 = read
+
+    def readinto(self, b) -> int:
+        self._check_open()
+        if self._copy is not None:
+            return self._copy.readinto(b)
+        data = self._view[self._pos:self._pos + len(b)]
+        b[:len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+    def write(self, b) -> int:
+        self._check_open()
+        return self._writable_copy().write(b)
+
+    def truncate(self, size:int=None) -> int:
+        self._check_open()
+        return self._writable_copy().truncate(size)
+
+    def getbuffer(self) -> memoryview:
+        self._check_open()
+        if self._copy is not None:
+            return self._copy.getbuffer()
+        return self._view.toreadonly() # Writing through it would change the original
+
+    def getvalue(self) -> bytes:
+        self._check_open()
+        if self._copy is not None:
+            return self._copy.getvalue()
+        return self._view.tobytes()
 
 class PxlObject:
     """
     An object you will get as a response to any request
 
     # Properties:
-        image_bytes (bytes): The image bytes of the response
+        image_bytes (bytes): The image bytes of the response. Can also be a `bytearray` or `memoryview`, it is never copied. If the image was written to a sink it is read from there when accessed
         data (string): The data of the response as a dictionary
         success (boolean): If the request was successfull or not
+        ok (boolean): Alias of `success`
         error (string): The error message if the request was not successful
         file_type (string): The file ending of the returned image(s)
         content_type (string): The content type of the image(s) returned
+        file (file or path): The sink the image was written to, if it can be read from
+        size (int): How many bytes the response has
+        buffer (memoryview): A read only view of the image bytes without copying them
+        info (ImageInfo): The dimensions, frame count, frame durations and loop count of a GIF, PNG or JPEG, read without decoding it
 
     # Methods:
         `convert_to_ioBytes()`
             Converts the image bytes to ioBytes
+        `reader()`
+            Returns a file-like object reading from the image bytes without copying them
+        `frames()`
+            Lazily iterates over the frames of the image as views of the image bytes
     """
-    def __init__(self, image_bytes:bytes=None, data:dict=None, success:bool=True, error:str=None, content_type:str=None):
-        self.image_bytes = image_bytes
+    __slots__ = ('_image_bytes', 'success', 'error', 'content_type', 'data', 'file', '_size', '_info', '_file_type')
+
+    def __init__(self, image_bytes:bytes=None, data:dict=None, success:bool=True, error:str=None, content_type:str=None, file=None, size:int=None):
+        self._image_bytes = image_bytes
         self.success = success
-        self.ok = self.success # Serves as alias
         self.error = error
         self.content_type = content_type
-        self.file_type = self.content_type.split('/')[1] if self.content_type else None
         self.data = data
+        self.file = file
+        self._size = size
+        self._info = None
+        self._file_type = None
+
+    @property
+    def ok(self) -> bool:
+        return self.success
+
+    @ok.setter
+    def ok(self, value:bool) -> None:
+        self.success = value
+
+    @property
+    def file_type(self) -> str:
+        if self._file_type is not None:
+            return self._file_type
+        return self.content_type.split('/')[1] if self.content_type else None
+
+    @file_type.setter
+    def file_type(self, value:str) -> None:
+        self._file_type = value
+
+    @property
+    def size(self) -> int:
+        if self._image_bytes is not None:
+            return len(self._image_bytes) if not isinstance(self._image_bytes, memoryview) else self._image_bytes.nbytes
+        return self._size
+
+    @size.setter
+    def size(self, value:int) -> None:
+        self._size = value
+
+    @property
+    def image_bytes(self) -> bytes:
+        if self._image_bytes is None and self.file is not None:
+            if isinstance(self.file, (str, os.PathLike)):
+                with open(self.file, 'rb') as f:
+                    return f.read()
+            return self._open().read()
+        return self._image_bytes
+
+    @image_bytes.setter
+    def image_bytes(self, value:bytes) -> None:
+        self._image_bytes = value
+        self._info = None
+
+    @property
+    def buffer(self) -> memoryview:
+        if self._image_bytes is None:
+            raise InvalidBytes("This object contains no bytes")
+        view = memoryview(self._image_bytes)
+        return view if view.readonly else view.toreadonly()
+
+    @property
+    def info(self) -> ImageInfo:
+        if self._info is None:
+            self._info = image_info(self.buffer)
+        return self._info
+
+    def frames(self) -> Iterator[Frame]:
+        """
+        Lazily iterates over the frames of a GIF, APNG, PNG or JPEG without decoding or copying them, still images have one frame.
+        `next(pxl.frames()).to_bytes()` gives the first frame as a standalone image, e.g. for a thumbnail
+
+        # Returns:
+            An iterator of `Frame`
+        """
+        return iter_frames(self.buffer)
+
+    def _open(self):
+        if isinstance(self.file, (str, os.PathLike)):
+            return open(self.file, 'rb')
+        self.file.seek(0)
+        return self.file
+
+    def reader(self) -> BufferReader:
+        if not self.success:
+            raise InvalidBytes("Cannot read from a failed request")
+        if self._image_bytes is None:
+            raise InvalidBytes("This object contains no bytes")
+        return BufferReader(self._image_bytes)
 
     def convert_to_ioBytes(self):
         if not self.success:
             raise InvalidBytes("Cannot convert a failed request to io bytes")
-        if not self.image_bytes:
+        if self._image_bytes is None and self.file is not None:
+            return self._open() # The sink already is a file, no need to copy it
+        if not self._image_bytes:
             raise InvalidBytes("This object contains no bytes")
 
-        return io.BytesIO(self.image_bytes)
-
-
-    
\ No newline at end of file
+        if isinstance(self._image_bytes, bytes):
+            return io.BytesIO(self._image_bytes) # Shares the immutable buffer until written to
+        return BufferReader(self._image_bytes)
@@ -0,0 +1,210 @@
+import asyncio
+import random
+import time
+
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+def _header_float(headers, name:str) -> float:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError: # Retry-After can also be an HTTP date which pxlapi does not send
+        return None
+
+def retry_after(headers) -> float:
+    """
+    Reads how many seconds to wait before the next request from rate limit headers
+
+    # Parameters:
+        `headers (mapping)`: The headers of the response
+
+    # Returns:
+        `float` or None if the headers do not say
+    """
+    after = _header_float(headers, 'Retry-After')
+    if after is None:
+        after = _header_float(headers, 'X-RateLimit-Reset-After')
+    if after is None and _header_float(headers, 'X-RateLimit-Remaining') == 0:
+        reset = _header_float(headers, 'X-RateLimit-Reset')
+        if reset is not None:
+            if reset > 1e12: # Timestamp in milliseconds
+                reset /= 1000
+            after = reset - time.time() if reset > 1e9 else reset
+    return max(after, 0) if after is not None else None
+
+class TokenBucket:
+    """
+    A token bucket allowing `rate` requests per second with bursts of up to `burst` requests
+
+    # Parameters:
+        `rate (float)`: How many tokens are added per second
+        `burst (int)`: How many tokens the bucket holds at most
+
+    # Methods:
+        `acquire()`
+            Waits until a token is available and takes it
+        `pause(seconds)`
+            Hands out no tokens for the given amount of seconds
+    """
+    def __init__(self, rate:float, burst:int=None):
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def reserve(self) -> float:
+        """
+        Takes a token, possibly one that is not there yet
+
+        # Returns:
+            `float`: How many seconds to wait until the token may be used
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return max(-self.tokens / self.rate, self.paused_until - now, 0)
+
+    async def acquire(self) -> float:
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    def pause(self, seconds:float) -> None:
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+class RateLimiter:
+    """
+    Limits how many requests a `PxlClient` sends, with one bucket shared by all endpoints and one bucket per endpoint.
+    Rate limit headers and 429 responses from pxlapi pause the affected bucket until the limit resets
+
+    # Optional parameters:
+        `rate (float)`: How many requests per second may be sent in total, None for no global limit
+        `burst (int)`: How many requests may be sent at once in total, defaults to `rate`
+        `endpoint_rate (float)`: How many requests per second may be sent to each endpoint, None for no per endpoint limit
+        `endpoint_burst (int)`: How many requests may be sent at once to each endpoint, defaults to `endpoint_rate`
+        `endpoints (dictionary)`: Overrides for single endpoints, e.g. `{"screenshot": (1, 2)}` for (rate, burst)
+
+    # Properties:
+        throttled (int): How many requests had to wait
+        waited (float): How many seconds requests waited in total
+    """
+    def __init__(self, rate:float=None, burst:int=None, endpoint_rate:float=None, endpoint_burst:int=None, endpoints:dict=None):
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.endpoint_rate = endpoint_rate
+        self.endpoint_burst = endpoint_burst
+        self.endpoints = endpoints or {}
+        self.buckets = {}
+        self.throttled = 0
+        self.waited = 0.0
+
+    @staticmethod
+    def _name(endpoint:str) -> str:
+        return endpoint.split('/')[0] # flag/trans and flag/gay share one limit
+
+    def _bucket(self, endpoint:str) -> TokenBucket:
+        name = self._name(endpoint)
+        bucket = self.buckets.get(name)
+        if bucket is None:
+            if name in self.endpoints:
+                bucket = TokenBucket(*self.endpoints[name])
+            elif self.endpoint_rate:
+                bucket = TokenBucket(self.endpoint_rate, self.endpoint_burst)
+            else: # Still tracked so Retry-After from pxlapi can pause the endpoint
+                bucket = TokenBucket(float('inf'), 1)
+            self.buckets[name] = bucket
+        return bucket
+
+    async def acquire(self, endpoint:str) -> None:
+        """
+        Waits until a request to `endpoint` may be sent
+
+        # Parameters:
+            `endpoint (string)`: The endpoint the request is made to
+        """
+        wait = self._bucket(endpoint).reserve()
+        if self.bucket is not None:
+            wait = max(wait, self.bucket.reserve())
+        if wait:
+            self.throttled += 1
+            self.waited += wait
+            await asyncio.sleep(wait)
+
+    def update(self, endpoint:str, status:int, headers) -> None:
+        """
+        Adapts to the rate limit information of a response
+
+        # Parameters:
+            `endpoint (string)`: The endpoint the request was made to
+            `status (int)`: The status of the response
+            `headers (mapping)`: The headers of the response
+        """
+        after = retry_after(headers)
+        if after is None and status == 429:
+            after = 1.0
+        if after:
+            self._bucket(endpoint).pause(after)
+
+    def stats(self) -> dict:
+        return {
+            'throttled': self.throttled,
+            'waited': self.waited
+        }
+
+class RetryPolicy:
+    """
+    When and how long to wait before retrying failed requests, using exponential backoff with full jitter
+
+    # Optional parameters:
+        `retries (int)`: How often to retry a request at most
+        `backoff (float)`: The base delay in seconds, doubled for every attempt
+        `max_backoff (float)`: The longest delay in seconds between two attempts
+        `deadline (float)`: How many seconds may pass since the first attempt before no more retries are made
+        `statuses (iterable)`: Which response statuses to retry, connection errors are always retried
+
+    # Properties:
+        retries_made (int): How many retries were made
+        gave_up (int): How many requests still failed after retrying
+    """
+    def __init__(self, retries:int=3, backoff:float=0.5, max_backoff:float=10.0, deadline:float=30.0, statuses=RETRY_STATUSES):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.statuses = frozenset(statuses)
+        self.retries_made = 0
+        self.gave_up = 0
+
+    def delay(self, attempt:int, elapsed:float, after:float=None) -> float:
+        """
+        How long to wait before the next attempt
+
+        # Parameters:
+            `attempt (int)`: How many attempts were made so far
+            `elapsed (float)`: How many seconds passed since the first attempt
+            `after (float)`: How long pxlapi asked to wait
+
+        # Returns:
+            `float` or None if the request should not be retried
+        """
+        if attempt > self.retries:
+            self.gave_up += 1
+            return None
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+        if after is not None:
+            delay = max(delay, after)
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            self.gave_up += 1
+            return None
+        self.retries_made += 1
+        return delay
+
+    def stats(self) -> dict:
+        return {
+            'retries': self.retries_made,
+            'gave_up': self.gave_up
+        }
@@ -0,0 +1,143 @@
+import asyncio
+import heapq
+import itertools
+from contextvars import ContextVar
+
+from .metrics import Histogram
+
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# The (priority, tenant) of the call being made, set by the client methods so it reaches the request wherever it is sent from
+current_call = ContextVar('pypxl_current_call', default=(0, None))
+
+class Scheduler:
+    """
+    Caps how many requests are in flight at once and decides which waiting request is sent next.
+    Requests with a higher priority always go first, requests with the same priority are shared fairly between tenants
+    (e.g. guilds), so one tenant sending many requests cannot starve the others. A tenant with twice the weight gets twice the share
+
+    # Optional parameters:
+        `max_in_flight (int)`: How many requests may be in flight at once
+        `weights (dictionary)`: The weight of tenants by their key, tenants not in it have `default_weight`
+        `default_weight (float)`: The weight of tenants not in `weights`
+        `buckets (tuple)`: The upper bounds of the queue wait histogram buckets in seconds
+
+    # Properties:
+        in_flight (int): How many requests are in flight
+        queued (int): How many requests are waiting for a slot
+        dispatched (int): How many requests were let through
+        waited (int): How many of those had to wait for a slot
+        wait (Histogram): How long requests waited for a slot in seconds
+        wait_by_priority (dictionary): A `Histogram` of the wait per priority
+    """
+    def __init__(self, max_in_flight:int=16, weights:dict=None, default_weight:float=1.0, buckets:tuple=WAIT_BUCKETS):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.max_in_flight = max_in_flight
+        self.weights = weights if weights is not None else {}
+        self.default_weight = default_weight
+        self.buckets = buckets
+        self.in_flight = 0
+        self.queued = 0
+        self.dispatched = 0
+        self.waited = 0
+        self.wait = Histogram(buckets)
+        self.wait_by_priority = {}
+        self._queue = [] # (-priority, virtual finish, sequence, future)
+        self._sequence = itertools.count()
+        self._virtual = 0.0
+        self._finish = {} # The virtual finish of the last queued request per tenant
+
+    def _observe(self, priority:int, seconds:float) -> None:
+        self.dispatched += 1
+        self.wait.observe(seconds)
+        histogram = self.wait_by_priority.get(priority)
+        if histogram is None:
+            histogram = self.wait_by_priority[priority] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def _tag(self, tenant) -> float:
+        # Weighted fair queuing: every request of a tenant starts after its previous one in virtual time and lasts 1 / weight
+        finish = max(self._virtual, self._finish.get(tenant, 0.0)) + 1.0 / self.weights.get(tenant, self.default_weight)
+        self._finish[tenant] = finish
+        return finish
+
+    async def acquire(self, priority:int=0, tenant=None) -> float:
+        """
+        Waits for a slot, which has to be given back with `release`
+
+        # Parameters:
+            `priority (int)`: Requests with a higher priority are let through first
+            `tenant (hashable)`: Who the request is made for, requests of the same priority are shared fairly between tenants
+
+        # Returns:
+            `float`, how many seconds were waited
+        """
+        if self.in_flight < self.max_in_flight and not self.queued:
+            self.in_flight += 1
+            self._observe(priority, 0.0)
+            return 0.0
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._queue, (-priority, self._tag(tenant), next(self._sequence), future))
+        self.queued += 1
+        self.waited += 1
+        start = loop.time()
+        try:
+            await future
+        except BaseException:
+            if future.cancelled():
+                self.queued -= 1 # The entry is skipped once it reaches the front
+            else: # The slot was handed over right before the caller was cancelled
+                self.release()
+            raise
+        waited = loop.time() - start
+        self._observe(priority, waited)
+        return waited
+
+    def release(self) -> None:
+        """
+        Gives back a slot, letting the next waiting request through
+        """
+        self.in_flight -= 1
+        while self._queue and self.in_flight < self.max_in_flight:
+            _, finish, _, future = heapq.heappop(self._queue)
+            if future.cancelled():
+                continue
+            self._virtual = finish
+            self.queued -= 1
+            self.in_flight += 1
+            future.set_result(None)
+        if not self._queue: # Without a backlog nobody is owed anything
+            self._virtual = 0.0
+            self._finish.clear()
+
+    async def run(self, factory):
+        """
+        Makes a request once it gets a slot, using the priority and tenant of the current call
+
+        # Parameters:
+            `factory (callable)`: Returns the coroutine making the request
+
+        # Returns:
+            Whatever the coroutine returns
+        """
+        priority, tenant = current_call.get()
+        await self.acquire(priority, tenant)
+        try:
+            return await factory()
+        finally:
+            self.release()
+
+    def stats(self) -> dict:
+        return {
+            'in_flight': self.in_flight,
+            'queued': self.queued,
+            'dispatched': self.dispatched,
+            'waited': self.waited,
+            'wait_seconds_total': self.wait.sum,
+            'wait_p50': self.wait.quantile(0.5),
+            'wait_p95': self.wait.quantile(0.95),
+            'wait_p99': self.wait.quantile(0.99)
+        }
@@ -0,0 +1,99 @@
+import ssl
+
+import aiohttp
+
+class ConnectionStats:
+    """
+    Counts how often the connection pool of a session had to open a new connection instead of reusing one
+
+    # Properties:
+        requests (int): How many requests were started
+        created (int): How many connections were opened
+        reused (int): How many requests were sent over an already open connection
+        queued (int): How many requests had to wait for a free connection
+    """
+    def __init__(self):
+        self.requests = 0
+        self.created = 0
+        self.reused = 0
+        self.queued = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+    async def _on_request_start(self, session, ctx, params) -> None:
+        self.requests += 1
+
+    async def _on_connection_create_end(self, session, ctx, params) -> None:
+        self.created += 1
+
+    async def _on_connection_reuseconn(self, session, ctx, params) -> None:
+        self.reused += 1
+
+    async def _on_connection_queued_start(self, session, ctx, params) -> None:
+        self.queued += 1
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self._on_request_start)
+        trace.on_connection_create_end.append(self._on_connection_create_end)
+        trace.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace.on_connection_queued_start.append(self._on_connection_queued_start)
+        return trace
+
+    def stats(self) -> dict:
+        return {
+            'requests': self.requests,
+            'created': self.created,
+            'reused': self.reused,
+            'queued': self.queued,
+            'reuse_ratio': self.reuse_ratio
+        }
+
+class PoolConfig:
+    """
+    Settings for the session a `PxlClient` creates when none is passed. All requests go to one host, so the defaults
+    keep a generous number of connections to it open and cache its DNS lookup
+
+    # Optional parameters:
+        `limit (int)`: How many connections may be open at once
+        `limit_per_host (int)`: How many connections may be open to pxlapi at once, 0 for no limit besides `limit`
+        `keepalive_timeout (float)`: How many seconds an idle connection is kept open for reuse
+        `ttl_dns_cache (int)`: How many seconds a DNS lookup is cached for
+        `connect_timeout (float)`: How many seconds opening a connection may take
+    """
+    def __init__(self, limit:int=100, limit_per_host:int=0, keepalive_timeout:float=60.0, ttl_dns_cache:int=300, connect_timeout:float=10.0):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.connect_timeout = connect_timeout
+        self._ssl = None
+
+    def create_session(self, stats:ConnectionStats=None) -> aiohttp.ClientSession:
+        """
+        Creates a session using these settings. Has to be called inside of a running event loop
+
+        # Parameters:
+            `stats (ConnectionStats)`: Where to count connection reuse
+
+        # Returns:
+            `aiohttp.ClientSession`
+        """
+        if self._ssl is None: # One context for all connections instead of loading the certificates for each session
+            self._ssl = ssl.create_default_context()
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=True,
+            ssl=self._ssl
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.connect_timeout),
+            trace_configs=[stats.trace_config()] if stats is not None else None
+        )
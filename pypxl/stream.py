@@ -0,0 +1,155 @@
+import asyncio
+import inspect
+import os
+import tempfile
+
+from typing import AsyncIterator
+
+CHUNK_SIZE = 64 * 1024
+
+def spool(max_size:int=1024*1024):
+    """
+    Creates a sink which keeps the image in memory until it grows larger than `max_size`, then moves it to a temporary file
+
+    # Parameters:
+        `max_size (int)`: How many bytes to keep in memory at most
+
+    # Returns:
+        `tempfile.SpooledTemporaryFile`
+    """
+    return tempfile.SpooledTemporaryFile(max_size=max_size)
+
+def readable_sink(sink) -> bool:
+    """
+    Checks if the image can be read back from a sink after it was written, true for paths and files opened for reading
+
+    # Parameters:
+        `sink`: A file path, a file descriptor or an object with a `write` method
+
+    # Returns:
+        `boolean`
+    """
+    if isinstance(sink, (str, os.PathLike)):
+        return True
+    readable = getattr(sink, 'readable', None)
+    if readable is None:
+        return hasattr(sink, 'read')
+    try:
+        return readable()
+    except ValueError: # Closed
+        return False
+
+def _write_all(fd:int, chunk:bytes) -> None:
+    view = memoryview(chunk)
+    while view:
+        view = view[os.write(fd, view):]
+
+async def write_chunks(chunks:AsyncIterator[bytes], sink) -> int:
+    """
+    Writes chunks to a sink as they arrive
+
+    # Parameters:
+        `chunks (async iterator)`: The chunks to write
+        `sink`: A file path, a file descriptor or an object with a `write` method, which may be a coroutine function. If it has a `drain` coroutine function it is awaited after every write.
+            Paths and file descriptors are written in the default executor, objects with a `write` method on the event loop
+
+    # Returns:
+        `int`: How many bytes were written
+    """
+    size = 0
+    loop = asyncio.get_running_loop()
+    if isinstance(sink, (str, os.PathLike)):
+        f = await loop.run_in_executor(None, open, sink, 'wb')
+        try:
+            async for chunk in chunks:
+                await loop.run_in_executor(None, f.write, chunk)
+                size += len(chunk)
+        finally:
+            await loop.run_in_executor(None, f.close)
+    elif isinstance(sink, int):
+        async for chunk in chunks:
+            await loop.run_in_executor(None, _write_all, sink, chunk)
+            size += len(chunk)
+    else:
+        drain = getattr(sink, 'drain', None)
+        async for chunk in chunks:
+            res = sink.write(chunk)
+            if inspect.isawaitable(res):
+                await res
+            if drain is not None:
+                await drain()
+            size += len(chunk)
+    return size
+
+class QueueWriter:
+    """
+    A sink putting chunks into a queue, waiting while it is full
+    """
+    __slots__ = ('queue',)
+
+    def __init__(self, queue:asyncio.Queue):
+        self.queue = queue
+
+    async def write(self, chunk:bytes) -> None:
+        await self.queue.put(chunk)
+
+class ChunkStream:
+    """
+    An async iterator over the chunks of an image as they are received from pxlapi.
+    Only a few chunks are buffered, if they are not consumed the download pauses.
+    The download is cancelled once the stream is no longer referenced, e.g. after leaving an `async for` early with `break`
+
+    # Properties:
+        result (PxlObject): The response once all chunks were received, it holds no image bytes
+
+    # Methods:
+        `aclose()`
+            Stops the download if the chunks are no longer needed
+    """
+    def __init__(self, method, kwargs:dict, buffer:int=16):
+        self.method = method
+        self.kwargs = kwargs
+        self._queue = asyncio.Queue(maxsize=buffer)
+        self._task = None
+
+    @property
+    def result(self):
+        task = self._task
+        if task is None or not task.done() or task.cancelled() or task.exception() is not None:
+            return None
+        return task.result()
+
+    def __aiter__(self):
+        if self._task is None:
+            # The task only references the queue, not the stream, so dropping the stream runs __del__ and cancels it
+            self._task = asyncio.ensure_future(self.method(sink=QueueWriter(self._queue), **self.kwargs))
+        return self
+
+    async def __anext__(self) -> bytes:
+        self.__aiter__()
+        while self._queue.empty():
+            if self._task.done():
+                self._task.result() # Raises the error if stop_on_error is enabled
+                raise StopAsyncIteration
+            getter = asyncio.ensure_future(self._queue.get())
+            await asyncio.wait((getter, self._task), return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                return getter.result()
+            getter.cancel()
+        return self._queue.get_nowait()
+
+    async def aclose(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def __del__(self) -> None:
+        task = self._task
+        if task is not None and not task.done():
+            try:
+                task.get_loop().call_soon_threadsafe(task.cancel) # The last reference may be dropped in another thread
+            except RuntimeError: # The loop is closed already
+                pass
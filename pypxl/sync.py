@@ -0,0 +1,244 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import Future
+from typing import Iterable, Iterator
+
+from .cache import ImageCache
+from .client import PxlClient
+from .endpoints import ENDPOINTS
+from .methods import SyncEndpointMethods
+from .pipeline import Pipeline, PipelineResult
+from .pxl_object import PxlObject
+
+class LoopThread:
+    """
+    Runs an event loop forever in a daemon thread, so synchronous code can run coroutines on it from any thread
+
+    # Optional parameters:
+        `name (string)`: The name of the thread
+
+    # Methods:
+        `start()`
+            Starts the thread if it is not running and returns its loop
+        `stop()`
+            Stops the loop and waits for the thread to exit
+    """
+    def __init__(self, name:str='pypxl-loop'):
+        self.name = name
+        self.loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self.loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+        return self.loop
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @property
+    def ident(self) -> int:
+        return self._thread.ident if self._thread is not None else None
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                return
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self.loop.close()
+            self._thread = None
+
+# The loop shared by all synchronous clients which are not given their own
+shared_loop = LoopThread()
+
+async def _create(factory):
+    return factory()
+
+class SyncPxlClient(SyncEndpointMethods):
+    """
+    A synchronous `PxlClient` for threaded code, e.g. Flask or Gunicorn workers. It has the same methods, which block until the result is there.
+    Requests run on one long lived event loop thread, so every thread using the client shares its connection pool and caches
+    instead of creating a new loop and session per request with `asyncio.run()`
+
+    # Parameters:
+        `token (string)`: Your pxlapi token
+
+    # Optional parameters:
+        `timeout (float)`: How many seconds a method may block at most before the request is cancelled and `TimeoutError` raised, None to wait forever
+        `loop_thread (LoopThread)`: Where to run the requests, defaults to a loop thread shared by all synchronous clients
+        Any other keyword argument of `PxlClient`, e.g. `cache` or `retry`. A `session` has to belong to the loop of `loop_thread`
+
+    # Properties:
+        client (PxlClient): The asynchronous client doing the work, its other properties such as `cache` can be accessed on this client as well
+
+    # Methods:
+        `submit(method, **kwargs)`
+            Starts a request without waiting for it and returns a `concurrent.futures.Future`, which can be cancelled
+        `close()`
+            Closes the session if the client created it
+    """
+    def __init__(self, token:str, timeout:float=None, loop_thread:LoopThread=None, **kwargs):
+        self.timeout = timeout
+        self.loop_thread = loop_thread or shared_loop
+        self.loop = self.loop_thread.start()
+        self.client = PxlClient(token, **kwargs)
+
+    def __getattr__(self, name:str):
+        if name == 'client': # Not set yet if __init__ failed
+            raise AttributeError(name)
+        value = getattr(self.client, name)
+        if asyncio.iscoroutinefunction(value):
+            raise AttributeError(f"{name} has no synchronous version, call it on the PxlClient in `client` instead")
+        return value
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _method(self, method):
+        if isinstance(method, str):
+            return getattr(self.client, method)
+        if getattr(method, '__self__', None) is self: # e.g. sync_pxl.glitch
+            return getattr(self.client, method.__name__)
+        return method
+
+    def submit(self, method, **kwargs) -> Future:
+        """
+        Starts a request on the loop thread without waiting for it
+
+        # Parameters:
+            `method (string or method)`: The method to call, e.g. `"flag"` or `pxl.flag`
+            `kwargs`: The arguments of the method
+
+        # Returns:
+            `concurrent.futures.Future` of a `PxlObject`. Cancelling it cancels the request
+        """
+        return asyncio.run_coroutine_threadsafe(self._method(method)(**kwargs), self.loop)
+
+    def _run(self, coro, timeout:float=None):
+        """
+        Runs a coroutine on the loop thread and waits for its result, cancelling it if the wait is interrupted. Not meant to be used outside of this class
+        """
+        if threading.get_ident() == self.loop_thread.ident:
+            coro.close()
+            raise RuntimeError("SyncPxlClient can not be used from its own event loop, use the PxlClient in `client` instead")
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(self.timeout if timeout is None else timeout)
+        except BaseException: # A timeout or KeyboardInterrupt, the request should not keep running
+            future.cancel()
+            raise
+
+    def _iterate(self, iterator, timeout:float=None) -> Iterator:
+        try:
+            while True:
+                try:
+                    yield self._run(iterator.__anext__(), timeout)
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(iterator.aclose(), timeout)
+
+    def close(self) -> None:
+        """
+        Closes the session if the client created it
+        """
+        self._run(self.client.close())
+
+    def request(self, endpoint:str, body, image:bool=True, sink=None, *, priority:int=0, tenant=None, deadline:float=None) -> PxlObject:
+        return self._run(self.client.request(endpoint, body, image, sink, priority=priority, tenant=tenant, deadline=deadline))
+    request.__doc__ = PxlClient.request.__doc__
+
+    def download(self, url:str) -> PxlObject:
+        return self._run(self.client.download(url))
+    download.__doc__ = PxlClient.download.__doc__
+
+    def map(self, method, kwargs:Iterable[dict], concurrency:int=8, ordered:bool=False) -> Iterator[PxlObject]:
+        """
+        Calls one method for every set of keyword arguments with a limited amount of requests in flight, yielding results as they come in.
+        `kwargs` is consumed on the loop thread. `timeout` applies to waiting for each result
+
+        # Parameters:
+            `method (string or method)`: The method to call, e.g. `"flag"` or `pxl.flag`
+            `kwargs (iterable)`: The keyword arguments for each call
+            `concurrency (int)`: How many requests may be in flight at once
+            `ordered (boolean)`: Whether to yield results in the order of `kwargs` instead of the order they complete in
+
+        # Returns:
+            An iterator of `PxlObject`
+        """
+        return self._iterate(self.client.map(self._method(method), kwargs, concurrency, ordered))
+
+    def stream(self, method, **kwargs) -> Iterator[bytes]:
+        """
+        Calls an image method and yields the image in chunks while it is received. `timeout` applies to waiting for each chunk
+
+        # Parameters:
+            `method (string or method)`: The image method to call, e.g. `"glitch"` or `pxl.glitch`
+            `kwargs`: The arguments of the method
+
+        # Returns:
+            An iterator of `bytes`
+        """
+        method = self._method(method)
+        return self._iterate(self._run(_create(lambda: self.client.stream(method, **kwargs))))
+
+    def pipeline(self, images:list=None, cache:ImageCache=None) -> 'SyncPipeline':
+        """
+        Creates a pipeline chaining image methods whose `run()` blocks until every stage is done, see `Pipeline`
+
+        # Optional parameters:
+            `images (list)`: The images stages without inputs start from
+            `cache (ImageCache)`: Where to keep intermediate results between runs, defaults to the cache of the client
+
+        # Returns:
+            `SyncPipeline`
+        """
+        return SyncPipeline(self, Pipeline(self.client, images, cache))
+
+class SyncPipeline:
+    """
+    A `Pipeline` of a `SyncPxlClient`. Stages are added the same way, `run()` blocks until every stage is done
+
+    # Properties:
+        pipeline (Pipeline): The asynchronous pipeline doing the work
+    """
+    def __init__(self, client:SyncPxlClient, pipeline:Pipeline):
+        self.client = client
+        self.pipeline = pipeline
+
+    @property
+    def stages(self) -> list:
+        return self.pipeline.stages
+
+    def stage(self, method:str, *inputs, name:str=None, **kwargs):
+        return self.pipeline.stage(method, *inputs, name=name, **kwargs)
+    stage.__doc__ = Pipeline.stage.__doc__
+
+    def run(self) -> PipelineResult:
+        return self.client._run(self.pipeline.run())
+    run.__doc__ = Pipeline.run.__doc__
+
+def _mirror(name:str):
+    method = getattr(PxlClient, name)
+
+    @functools.wraps(method)
+    def call(self, *args, **kwargs) -> PxlObject:
+        return self._run(method(self.client, *args, **kwargs))
+
+    call.__qualname__ = f'SyncPxlClient.{name}'
+    call.__module__ = __name__
+    return call
+
+for _name in [endpoint.name for endpoint in ENDPOINTS]:
+    setattr(SyncPxlClient, _name, _mirror(_name))
+del _name
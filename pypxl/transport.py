@@ -0,0 +1,301 @@
+import asyncio
+import inspect
+import json
+
+import aiohttp
+
+from .session import PoolConfig, ConnectionStats
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+class Transport:
+    """
+    How requests are sent to pxlapi. Subclasses implement `post`, which returns a response with the parts of `aiohttp.ClientResponse`
+    the client uses: `status`, `headers`, `content_type`, `read()`, `text()`, `release()` and `content.iter_chunked(size)`
+
+    # Properties:
+        errors (tuple): The exceptions raised for failed connections, requests failing with them are retried
+
+    # Methods:
+        `open()`
+            Prepares the transport, e.g. creates its connection pool
+        `post(url, headers, body, timeout)`
+            Sends a request
+        `get(url, timeout)`
+            Downloads a file, e.g. an image found by `image_search`
+        `close()`
+            Closes the connections the transport opened
+    """
+    errors = (ConnectionError, asyncio.TimeoutError)
+
+    async def open(self) -> None:
+        pass
+
+    async def post(self, url:str, headers:dict, body:bytes, timeout:float=None):
+        """
+        Sends a POST request
+
+        # Parameters:
+            `url (string)`: Where to send the request to
+            `headers (dictionary)`: The headers of the request
+            `body (bytes)`: The encoded body
+            `timeout (float)`: How many seconds connecting, sending and reading the response may take together, None for no limit
+
+        # Returns:
+            The response, its body is not read yet
+        """
+        raise NotImplementedError
+
+    async def get(self, url:str, timeout:float=None):
+        """
+        Sends a GET request without the pxlapi headers, so the token is not sent to other hosts
+
+        # Parameters:
+            `url (string)`: What to download
+            `timeout (float)`: How many seconds connecting, sending and reading the response may take together, None for no limit
+
+        # Returns:
+            The response, its body is not read yet
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        return {}
+
+class AiohttpTransport(Transport):
+    """
+    Sends requests over HTTP/1.1 with aiohttp, the default transport
+
+    # Optional parameters:
+        `session (aiohttp client session)`: The session to use. If none is passed one is created with `pool` and closed with the transport
+        `pool (PoolConfig)`: Connection pool settings for the session the transport creates
+        `stats (ConnectionStats)`: Where to count connection reuse of the session the transport creates
+    """
+    errors = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+    def __init__(self, session:aiohttp.ClientSession=None, pool:PoolConfig=None, stats:ConnectionStats=None):
+        self.session = session
+        self.owns_session = session is None
+        self.pool = pool or PoolConfig()
+        self.pool_stats = stats if stats is not None else ConnectionStats()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.owns_session and (self.session is None or self.session.closed):
+            self.session = self.pool.create_session(self.pool_stats)
+        return self.session
+
+    async def open(self) -> None:
+        self._get_session()
+
+    async def post(self, url:str, headers:dict, body:bytes, timeout:float=None) -> aiohttp.ClientResponse:
+        if timeout is None:
+            return await self._get_session().post(url, headers=headers, data=body)
+        return await self._get_session().post(url, headers=headers, data=body, timeout=aiohttp.ClientTimeout(total=timeout))
+
+    async def get(self, url:str, timeout:float=None) -> aiohttp.ClientResponse:
+        if timeout is None:
+            return await self._get_session().get(url)
+        return await self._get_session().get(url, timeout=aiohttp.ClientTimeout(total=timeout))
+
+    async def close(self) -> None:
+        if self.owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def stats(self) -> dict:
+        return self.pool_stats.stats()
+
+class Http2Response:
+    """
+    Gives an `httpx.Response` the parts of `aiohttp.ClientResponse` the client uses
+    """
+    __slots__ = ('_response', 'status', 'headers', 'content_type')
+
+    def __init__(self, response):
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+        self.content_type = response.headers.get('content-type', 'application/octet-stream').split(';')[0].strip()
+
+    @property
+    def content(self):
+        return self
+
+    async def read(self) -> bytes:
+        try:
+            return await self._response.aread()
+        finally:
+            await self._response.aclose()
+
+    async def text(self) -> str:
+        await self.read()
+        return self._response.text
+
+    async def iter_chunked(self, size:int):
+        try:
+            async for chunk in self._response.aiter_bytes(size):
+                yield chunk
+        finally:
+            await self._response.aclose()
+
+    def release(self) -> None:
+        asyncio.ensure_future(self._response.aclose())
+
+class Http2Transport(Transport):
+    """
+    Sends requests over HTTP/2 with httpx, multiplexing many concurrent requests over a few connections instead of opening one per request.
+    Requires httpx with HTTP/2 support, install it with `pip3 install pypxl[http2]`
+
+    # Optional parameters:
+        `client (httpx.AsyncClient)`: The client to use. If none is passed one is created and closed with the transport
+        `max_connections (int)`: How many connections may be open at once
+        `keepalive_timeout (float)`: How many seconds an idle connection is kept open
+        `connect_timeout (float)`: How many seconds opening a connection may take
+    """
+    errors = (httpx.TransportError, asyncio.TimeoutError) if httpx is not None else ()
+
+    def __init__(self, client=None, max_connections:int=4, keepalive_timeout:float=60.0, connect_timeout:float=10.0):
+        if httpx is None:
+            raise ImportError("The HTTP/2 transport requires httpx, install it with pip3 install pypxl[http2]")
+        self.client = client
+        self.owns_client = client is None
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        self.connect_timeout = connect_timeout
+
+    def _get_client(self):
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections, keepalive_expiry=self.keepalive_timeout),
+                timeout=httpx.Timeout(None, connect=self.connect_timeout)
+            )
+        return self.client
+
+    async def open(self) -> None:
+        self._get_client()
+
+    async def post(self, url:str, headers:dict, body:bytes, timeout:float=None) -> Http2Response:
+        client = self._get_client()
+        if timeout is None:
+            request = client.build_request('POST', url, headers=headers, content=body)
+        else:
+            request = client.build_request('POST', url, headers=headers, content=body, timeout=httpx.Timeout(timeout))
+        return Http2Response(await client.send(request, stream=True))
+
+    async def get(self, url:str, timeout:float=None) -> Http2Response:
+        client = self._get_client()
+        if timeout is None:
+            request = client.build_request('GET', url)
+        else:
+            request = client.build_request('GET', url, timeout=httpx.Timeout(timeout))
+        return Http2Response(await client.send(request, stream=True))
+
+    async def close(self) -> None:
+        if self.owns_client and self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+class CannedResponse:
+    """
+    A response served by `MemoryTransport`. The same response can be served any number of times
+
+    # Optional parameters:
+        `body (bytes, string, dictionary or list)`: The body, dictionaries and lists are encoded as json
+        `status (int)`: The status code
+        `content_type (string)`: The content type, guessed from the type of `body` if not set
+        `headers (dictionary)`: The headers, e.g. `Retry-After`
+    """
+    __slots__ = ('body', 'status', 'content_type', 'headers')
+
+    def __init__(self, body=b'', status:int=200, content_type:str=None, headers:dict=None):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode()
+            content_type = content_type or 'application/json'
+        elif isinstance(body, str):
+            body = body.encode()
+            content_type = content_type or 'text/plain'
+        self.body = bytes(body)
+        self.status = status
+        self.content_type = content_type or 'application/octet-stream'
+        self.headers = headers or {}
+
+    @property
+    def content(self):
+        return self
+
+    async def read(self) -> bytes:
+        return self.body
+
+    async def text(self) -> str:
+        return self.body.decode()
+
+    async def iter_chunked(self, size:int):
+        for i in range(0, len(self.body), size):
+            yield self.body[i:i + size]
+
+    def release(self) -> None:
+        pass
+
+class MemoryTransport(Transport):
+    """
+    Serves canned responses without any network, for tests and for benchmarking the client itself
+
+    # Optional parameters:
+        `responses (dictionary)`: What to answer by endpoint, e.g. `{"flag": CannedResponse(png), "image_search": CannedResponse(results)}`.
+            Keys are full paths like `flag/trans` or their first segment, or full urls for downloads with `get`. Values are `CannedResponse`s
+            or functions called with `(path, body)` returning one, which may be async and may raise `ConnectionError` to simulate a failed connection
+        `default (CannedResponse)`: What to answer for endpoints not in `responses`, a 404 if not set
+        `latency (float)`: How many seconds each request takes
+        `record (boolean)`: Whether to keep every `(path, body)` sent in `sent`
+
+    # Properties:
+        requests (int): How many requests were made
+        sent (list): The `(path, body)` of every request if `record` is enabled
+    """
+    def __init__(self, responses:dict=None, default:CannedResponse=None, latency:float=0.0, record:bool=False):
+        self.responses = dict(responses) if responses is not None else {}
+        self.default = default if default is not None else CannedResponse('Unknown endpoint', 404)
+        self.latency = latency
+        self.record = record
+        self.requests = 0
+        self.sent = []
+
+    def add(self, path:str, response) -> None:
+        self.responses[path] = response
+
+    async def _respond(self, key:str, response, body:bytes, timeout:float) -> CannedResponse:
+        self.requests += 1
+        if self.record:
+            self.sent.append((key, body))
+        if self.latency:
+            if timeout is not None and timeout < self.latency:
+                await asyncio.sleep(timeout)
+                raise asyncio.TimeoutError()
+            await asyncio.sleep(self.latency)
+        if callable(response):
+            response = response(key, body)
+            if inspect.isawaitable(response):
+                response = await response
+        return response
+
+    async def post(self, url:str, headers:dict, body:bytes, timeout:float=None) -> CannedResponse:
+        path = url.split('/', 3)[3] if url.count('/') >= 3 else url
+        response = self.responses.get(path)
+        if response is None:
+            response = self.responses.get(path.split('/')[0], self.default)
+        return await self._respond(path, response, body, timeout)
+
+    async def get(self, url:str, timeout:float=None) -> CannedResponse:
+        return await self._respond(url, self.responses.get(url, self.default), None, timeout)
+
+    def stats(self) -> dict:
+        return {
+            'requests': self.requests
+        }
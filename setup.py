@@ -18,13 +18,18 @@ setup(
       },
     author="Kile",
     packages=find_packages(),
+    package_data={"pypxl": ["py.typed", "*.pyi"]},
+    python_requires=">=3.8",
     install_requires=["aiohttp"],
+    extras_require={
+        "fast": ["orjson"],
+        "preprocess": ["Pillow"],
+        "http2": ["httpx[http2]"]
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
         "Topic :: Software Development :: Build Tools",
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "License :: OSI Approved :: MIT License",
@@ -0,0 +1,101 @@
+import asyncio
+import os
+
+from pypxl import PxlClient, PxlObject
+from pypxl.cache import DiskCache
+from pypxl.transport import CannedResponse, MemoryTransport
+
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x00' * 92
+
+def image(data=PNG, content_type='image/png'):
+    return PxlObject(image_bytes=data, content_type=content_type)
+
+def entry_size(data=PNG, content_type='image/png'):
+    return len(DiskCache.MAGIC) + len(content_type) + 1 + len(data)
+
+def age(cache, key, mtime):
+    os.utime(cache._file(key), (mtime, mtime))
+
+def test_hit_is_memory_mapped(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.put('a', image())
+    hit = cache.get('a')
+    assert hit.success
+    assert hit.content_type == 'image/png'
+    assert isinstance(hit.image_bytes, memoryview) and hit.image_bytes.readonly
+    assert bytes(hit.image_bytes) == PNG
+    assert (cache.hits, cache.misses, cache.size) == (1, 0, entry_size())
+
+def test_misses(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    assert cache.get('missing') is None
+    (tmp_path / ('empty' + DiskCache.SUFFIX)).write_bytes(b'')
+    assert cache.get('empty') is None
+    (tmp_path / ('corrupt' + DiskCache.SUFFIX)).write_bytes(b'not a cache entry')
+    assert cache.get('corrupt') is None
+    assert (cache.hits, cache.misses) == (0, 3)
+
+def test_only_successful_responses_that_fit_are_stored(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=entry_size())
+    cache.put('failed', PxlObject(success=False, error='Bad request'))
+    cache.put('large', image(PNG + b'\x00'))
+    assert cache.get('failed') is None and cache.get('large') is None
+    assert cache.size == 0
+    assert not any(name.endswith(DiskCache.SUFFIX) for name in os.listdir(tmp_path))
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=entry_size() * 2)
+    cache.put('a', image())
+    cache.put('b', image())
+    age(cache, 'a', 1000)
+    age(cache, 'b', 2000)
+    assert cache.get('a') is not None # Makes a the most recently used
+    cache.put('c', image())
+    assert cache.evictions == 1
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert cache.size == entry_size() * 2
+
+def test_eviction_does_not_break_mapped_hits(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=entry_size())
+    cache.put('a', image())
+    hit = cache.get('a')
+    cache.put('b', image(PNG[:-1] + b'\x01'))
+    assert cache.get('a') is None
+    assert bytes(hit.image_bytes) == PNG
+
+def test_shared_between_instances(tmp_path):
+    DiskCache(str(tmp_path)).put('a', image())
+    other = DiskCache(str(tmp_path))
+    assert other.size == entry_size()
+    assert bytes(other.get('a').image_bytes) == PNG
+
+def test_rescan_accounts_for_other_writers(tmp_path):
+    first = DiskCache(str(tmp_path), max_bytes=entry_size() * 2, rescan_every=1)
+    second = DiskCache(str(tmp_path), max_bytes=entry_size() * 2, rescan_every=1)
+    first.put('a', image())
+    age(first, 'a', 1000)
+    second.put('b', image())
+    age(second, 'b', 2000)
+    first.put('c', image()) # first only knows about its own writes until it rescans
+    assert first.get('a') is None
+    assert second.get('b') is not None and second.get('c') is not None
+
+def test_clear(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.put('a', image())
+    cache.put('b', image())
+    cache.clear()
+    assert cache.size == 0
+    assert cache.get('a') is None and cache.get('b') is None
+
+def test_client_serves_hits_from_disk(tmp_path):
+    async def main():
+        transport = MemoryTransport({'flash': CannedResponse(PNG, content_type='image/png')})
+        for _ in range(2): # A new client, like after a restart
+            async with PxlClient('token', transport=transport, disk_cache=DiskCache(str(tmp_path))) as client:
+                res = await client.flash(images=['https://example.com/a.png'])
+                assert res.success and bytes(res.image_bytes) == PNG
+        assert transport.requests == 1
+        assert isinstance(res.image_bytes, memoryview)
+    asyncio.run(main())
@@ -0,0 +1,147 @@
+import struct
+import zlib
+
+import pytest
+
+from pypxl import PxlObject, image_info, iter_frames
+from pypxl.errors import InvalidBytes
+
+def gif(delays=(5, 30), loop=0, size=(4, 3)):
+    """
+    An animated GIF with a global color table, a NETSCAPE loop extension and one frame per delay (in 1/100 s)
+    """
+    width, height = size
+    data = [b'GIF89a', struct.pack('<HHBBB', width, height, 0x80, 0, 0), b'\x00\x00\x00\xff\xff\xff']
+    if loop is not None:
+        data.append(b'\x21\xff\x0bNETSCAPE2.0\x03\x01' + struct.pack('<H', loop) + b'\x00')
+    for i, delay in enumerate(delays):
+        data.append(b'\x21\xf9\x04' + struct.pack('<BHB', 2 << 2, delay, 0) + b'\x00')
+        data.append(b'\x2c' + struct.pack('<HHHHB', i, 0, width - i, height, 0))
+        data.append(b'\x02\x02\x4c\x01\x00') # LZW minimum code size and one sub-block
+    data.append(b';')
+    return b''.join(data)
+
+def chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(data, zlib.crc32(kind)))
+
+def png(frames=None, size=(4, 3), plays=0):
+    """
+    A PNG, or an APNG if `frames` is a list of `(width, height, x, y, numerator, denominator)`
+    """
+    width, height = size
+    parts = [b'\x89PNG\r\n\x1a\n', chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)), chunk(b'PLTE', b'\x00\x00\x00')]
+    if not frames:
+        parts.append(chunk(b'IDAT', zlib.compress(b'\x00' * (width * 4 + 1) * height)))
+    else:
+        parts.append(chunk(b'acTL', struct.pack('>II', len(frames), plays)))
+        sequence = 0
+        for i, (w, h, x, y, numerator, denominator) in enumerate(frames):
+            parts.append(chunk(b'fcTL', struct.pack('>IIIIIHHBB', sequence, w, h, x, y, numerator, denominator, 1, 0)))
+            sequence += 1
+            data = zlib.compress(b'\x00' * (w * 4 + 1) * h)
+            if i == 0:
+                parts.append(chunk(b'IDAT', data))
+            else:
+                parts.append(chunk(b'fdAT', struct.pack('>I', sequence) + data))
+                sequence += 1
+    parts.append(chunk(b'IEND', b''))
+    return b''.join(parts)
+
+def jpeg(size=(5, 7)):
+    width, height = size
+    app0 = b'\xff\xe0' + struct.pack('>H', 16) + b'JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00'
+    sof = b'\xff\xc0' + struct.pack('>HBHHB', 17, 8, height, width, 3) + b'\x01\x22\x00\x02\x11\x01\x03\x11\x01'
+    return b'\xff\xd8' + app0 + sof + b'\xff\xd9'
+
+APNG_FRAMES = [(4, 3, 0, 0, 1, 10), (2, 2, 1, 1, 25, 100)]
+
+def test_gif_info():
+    info = image_info(gif())
+    assert (info.format, info.width, info.height) == ('gif', 4, 3)
+    assert info.frame_count == 2
+    assert info.durations == (50, 300)
+    assert info.duration == 350
+    assert info.loop == 0
+    assert info.animated
+
+def test_still_gif_has_no_loop_or_durations():
+    info = image_info(gif(delays=(7,), loop=None))
+    assert info.frame_count == 1
+    assert info.durations == ()
+    assert info.loop is None
+    assert not info.animated
+
+def test_gif_frames_are_views():
+    data = gif()
+    frames = list(iter_frames(data))
+    assert [(f.index, f.x, f.width, f.duration, f.disposal) for f in frames] == [(0, 0, 4, 50, 2), (1, 1, 3, 300, 2)]
+    assert all(isinstance(f.data, memoryview) and f.data.readonly for f in frames)
+    still = image_info(frames[1].to_bytes())
+    assert (still.width, still.height, still.frame_count) == (4, 3, 1)
+
+def test_png_info():
+    info = image_info(png(size=(6, 2)))
+    assert (info.format, info.width, info.height, info.frame_count) == ('png', 6, 2, 1)
+    assert info.durations == ()
+    assert info.loop is None
+
+def test_png_still_frame_is_the_image():
+    data = png()
+    frames = list(iter_frames(data))
+    assert len(frames) == 1
+    assert frames[0].duration is None
+    assert frames[0].to_bytes() == data
+
+def test_apng_info():
+    info = image_info(png(APNG_FRAMES, plays=3))
+    assert info.frame_count == 2
+    assert info.durations == (100, 250)
+    assert info.loop == 3
+
+def test_apng_frames_build_standalone_pngs():
+    frames = list(iter_frames(png(APNG_FRAMES)))
+    assert [(f.width, f.height, f.x, f.y, f.duration, f.disposal) for f in frames] == [(4, 3, 0, 0, 100, 1), (2, 2, 1, 1, 250, 1)]
+    for frame in frames:
+        still = frame.to_bytes()
+        info = image_info(still)
+        assert (info.width, info.height, info.frame_count) == (frame.width, frame.height, 1)
+        assert b'PLTE' in still # Ancillary chunks before the image data are kept
+
+def test_jpeg_info():
+    info = image_info(jpeg())
+    assert (info.format, info.width, info.height, info.frame_count) == ('jpeg', 5, 7, 1)
+    assert len(list(iter_frames(jpeg()))) == 1
+
+def test_unknown_format():
+    with pytest.raises(InvalidBytes):
+        image_info(b'BM' + b'\x00' * 40)
+
+@pytest.mark.parametrize('data', [gif(), gif(delays=(7,), loop=None), png(), png(APNG_FRAMES)], ids=['gif', 'still gif', 'png', 'apng'])
+def test_truncated_images_raise(data):
+    for cut in range(len(data)):
+        with pytest.raises(InvalidBytes):
+            image_info(data[:cut])
+        with pytest.raises(InvalidBytes):
+            list(iter_frames(data[:cut]))
+
+def test_truncated_jpeg_before_frame_header_raises():
+    data = jpeg()
+    for cut in range(data.index(b'\xff\xc0') + 9):
+        with pytest.raises(InvalidBytes):
+            image_info(data[:cut])
+
+def test_pxl_object_info_is_cached_and_reset():
+    obj = PxlObject(image_bytes=gif(), content_type='image/gif')
+    assert obj.info is obj.info
+    assert len(list(obj.frames())) == 2
+    obj.image_bytes = bytearray(png())
+    assert obj.info.format == 'png'
+
+def test_matches_pillow():
+    Image = pytest.importorskip('PIL.Image')
+    import io
+    frames = [Image.new('RGB', (20, 10), (i * 60, 0, 0)) for i in range(3)]
+    out = io.BytesIO()
+    frames[0].save(out, 'GIF', save_all=True, append_images=frames[1:], duration=[50, 300, 70], loop=2)
+    info = image_info(out.getvalue())
+    assert (info.width, info.height, info.frame_count, info.durations, info.loop) == (20, 10, 3, (50, 300, 70), 2)
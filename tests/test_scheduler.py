@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+from pypxl import PxlClient
+from pypxl.scheduler import Scheduler, current_call
+from pypxl.transport import CannedResponse, MemoryTransport
+
+async def dispatch_order(scheduler, requests):
+    """
+    Holds every slot, queues `requests` as `(name, priority, tenant)` and returns the order they are let through in
+    """
+    for _ in range(scheduler.max_in_flight):
+        await scheduler.acquire()
+    order = []
+
+    async def waiter(name, priority, tenant):
+        await scheduler.acquire(priority, tenant)
+        order.append(name)
+        scheduler.release()
+
+    tasks = [asyncio.ensure_future(waiter(*request)) for request in requests]
+    await asyncio.sleep(0)
+    assert scheduler.queued == len(requests)
+    for _ in range(scheduler.max_in_flight):
+        scheduler.release()
+    await asyncio.gather(*tasks)
+    assert (scheduler.in_flight, scheduler.queued) == (0, 0)
+    return order
+
+def test_max_in_flight_must_be_positive():
+    with pytest.raises(ValueError):
+        Scheduler(max_in_flight=0)
+
+def test_acquire_without_waiting_below_the_cap():
+    async def main():
+        scheduler = Scheduler(max_in_flight=2)
+        assert await scheduler.acquire() == 0.0
+        assert await scheduler.acquire() == 0.0
+        assert (scheduler.in_flight, scheduler.queued, scheduler.dispatched, scheduler.waited) == (2, 0, 2, 0)
+    asyncio.run(main())
+
+def test_higher_priority_goes_first():
+    order = asyncio.run(dispatch_order(Scheduler(max_in_flight=1), [('low', 0, None), ('high', 5, None), ('mid', 1, None), ('low 2', 0, None)]))
+    assert order == ['high', 'mid', 'low', 'low 2']
+
+def test_tenants_are_interleaved():
+    requests = [('a1', 0, 'a'), ('a2', 0, 'a'), ('a3', 0, 'a'), ('a4', 0, 'a'), ('b1', 0, 'b'), ('b2', 0, 'b')]
+    order = asyncio.run(dispatch_order(Scheduler(max_in_flight=1), requests))
+    assert order == ['a1', 'b1', 'a2', 'b2', 'a3', 'a4']
+
+def test_weights_share_capacity():
+    requests = [('a1', 0, 'a'), ('a2', 0, 'a'), ('a3', 0, 'a'), ('a4', 0, 'a'), ('b1', 0, 'b'), ('b2', 0, 'b')]
+    order = asyncio.run(dispatch_order(Scheduler(max_in_flight=1, weights={'a': 2}), requests))
+    assert order == ['a1', 'a2', 'b1', 'a3', 'a4', 'b2']
+
+def test_priority_beats_fairness():
+    requests = [('a1', 0, 'a'), ('a2', 0, 'a'), ('b1', 1, 'b'), ('b2', 1, 'b')]
+    assert asyncio.run(dispatch_order(Scheduler(max_in_flight=1), requests)) == ['b1', 'b2', 'a1', 'a2']
+
+def test_cancelled_waiter_is_skipped():
+    async def main():
+        scheduler = Scheduler(max_in_flight=1)
+        await scheduler.acquire()
+        first = asyncio.ensure_future(scheduler.acquire(tenant='a'))
+        second = asyncio.ensure_future(scheduler.acquire(tenant='b'))
+        await asyncio.sleep(0)
+        assert scheduler.queued == 2
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert scheduler.queued == 1
+        scheduler.release()
+        await second
+        assert (scheduler.in_flight, scheduler.queued) == (1, 0)
+        scheduler.release()
+        assert scheduler.in_flight == 0
+        assert scheduler._queue == [] and scheduler._finish == {}
+    asyncio.run(main())
+
+def test_slot_handed_to_a_cancelled_waiter_is_given_back():
+    async def main():
+        scheduler = Scheduler(max_in_flight=1)
+        await scheduler.acquire()
+        waiter = asyncio.ensure_future(scheduler.acquire())
+        await asyncio.sleep(0)
+        scheduler.release() # Hands the slot over, the waiter has not run yet
+        assert (scheduler.in_flight, scheduler.queued) == (1, 0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert scheduler.in_flight == 0
+        assert await scheduler.acquire() == 0.0
+    asyncio.run(main())
+
+def test_run_uses_the_current_call():
+    async def main():
+        scheduler = Scheduler(max_in_flight=1)
+        await scheduler.acquire()
+        order = []
+
+        async def call(name, priority):
+            current_call.set((priority, None))
+            async def send():
+                order.append(name)
+            await scheduler.run(send)
+
+        tasks = [asyncio.ensure_future(call('low', 0)), asyncio.ensure_future(call('high', 3))]
+        await asyncio.sleep(0)
+        scheduler.release()
+        await asyncio.gather(*tasks)
+        assert order == ['high', 'low']
+        assert set(scheduler.wait_by_priority) == {0, 3}
+        assert scheduler.in_flight == 0
+    asyncio.run(main())
+
+def test_client_sends_by_priority():
+    async def main():
+        transport = MemoryTransport({'flip': CannedResponse(b'png', content_type='image/png')}, latency=0.01, record=True)
+        async with PxlClient('token', transport=transport, scheduler=Scheduler(max_in_flight=1)) as client:
+            calls = [client.request(f'flip/{i}', {}, priority=i) for i in range(4)]
+            results = await asyncio.gather(*calls)
+        assert all(result.success for result in results)
+        # The first request takes the free slot, the others wait and go highest priority first
+        assert [path for path, _ in transport.sent] == ['flip/0', 'flip/3', 'flip/2', 'flip/1']
+    asyncio.run(main())